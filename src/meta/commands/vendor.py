@@ -281,11 +281,16 @@ def verify(
 def backup(
     backup_name: Optional[str] = typer.Option(None, "--name", "-n", help="Backup name (defaults to timestamp)"),
     include_components: bool = typer.Option(True, "--include-components/--no-include-components", help="Include components directory"),
+    force_deep_copy: bool = typer.Option(False, "--force-deep-copy", help="Allow copying very large components trees when they cannot be cloned or hardlinked"),
 ):
     """Create a backup of the current meta-repo state."""
     from meta.utils.vendor_backup import create_backup
     
-    backup_path = create_backup(backup_name, include_components=include_components)
+    backup_path = create_backup(
+        backup_name,
+        include_components=include_components,
+        force_deep_copy=force_deep_copy
+    )
     if backup_path:
         success(f"Backup created: {backup_path}")
     else:
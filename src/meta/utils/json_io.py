@@ -0,0 +1,64 @@
+"""JSON file helpers for small, frequently rewritten state files."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+try:
+    import orjson as _json_fast
+except ImportError:  # orjson is optional
+    _json_fast = None
+
+
+def dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when installed."""
+    if _json_fast is not None:
+        return _json_fast.dumps(obj, option=_json_fast.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed.
+    
+    Raises json.JSONDecodeError on invalid input (orjson's error type
+    subclasses it).
+    """
+    if _json_fast is not None:
+        return _json_fast.loads(data)
+    return json.loads(data)
+
+
+def dump_json(obj: Any, path: Path, durable: bool = False):
+    """Write obj as indented JSON, atomically replacing path.
+    
+    The data is written to a sibling temporary file which is then renamed
+    over path, so readers never see a partially written file.
+    
+    Args:
+        obj: JSON-serializable object
+        path: Destination file
+        durable: fsync the data before the rename so it survives power loss
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open('wb') as f:
+        f.write(dumps_json(obj, indent=True))
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_json(path: Path) -> Any:
+    """Read and parse a JSON file."""
+    return loads_json(Path(path).read_bytes())
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """Return a file's (mtime_ns, size) for cache validation, or None if missing."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
@@ -3,15 +3,39 @@
 import yaml
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Mapping, Tuple
 from meta.utils.logger import error
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+# components.yaml path -> ((mtime_ns, size), parsed components)
+_components_cache: Dict[str, Tuple[Tuple[int, int], Mapping[str, Any]]] = {}
+
+
+# Absolute start path -> meta-repo root found from it (hits only)
+_repo_root_cache: Dict[str, Path] = {}
+
 
 def find_meta_repo_root(start_path: Optional[str] = None) -> Optional[Path]:
-    """Find the meta-repo root by looking for manifests/ directory."""
+    """Find the meta-repo root by looking for manifests/ directory.
+    
+    Successful lookups are cached per start directory, so repeated calls
+    within a process skip the upward directory walk. Misses are not cached,
+    so a meta-repo created later in the process is still found.
+    """
     if start_path is None:
         start_path = os.getcwd()
     
+    cache_key = os.path.abspath(start_path)
+    cached = _repo_root_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     current = Path(start_path).resolve()
     
     # Walk up the directory tree
@@ -20,11 +44,17 @@ def find_meta_repo_root(start_path: Optional[str] = None) -> Optional[Path]:
         if manifests_dir.exists() and manifests_dir.is_dir():
             # Verify it's a meta-repo by checking for components.yaml
             if (manifests_dir / "components.yaml").exists():
+                _repo_root_cache[cache_key] = path
                 return path
     
     return None
 
 
+def clear_meta_repo_root_cache():
+    """Forget cached meta-repo roots (e.g. after moving or deleting a repo)."""
+    _repo_root_cache.clear()
+
+
 def load_yaml(file_path: str) -> Dict[str, Any]:
     """Load and parse a YAML file."""
     path = Path(file_path)
@@ -34,7 +64,7 @@ def load_yaml(file_path: str) -> Dict[str, Any]:
     
     with open(path, 'r') as f:
         try:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_SafeLoader) or {}
         except yaml.YAMLError as e:
             error(f"Failed to parse YAML file {file_path}: {e}")
             raise
@@ -45,6 +75,31 @@ def get_components(manifests_dir: str = "manifests") -> Dict[str, Any]:
     return load_yaml(f"{manifests_dir}/components.yaml").get("components", {})
 
 
+def get_components_cached(manifests_dir: str = "manifests") -> Mapping[str, Any]:
+    """Load components manifest, reusing the parse while the file is unchanged.
+    
+    The cache is keyed on the file's mtime and size, so edits are picked up
+    on the next call. The result is a read-only view shared between callers;
+    nested component dictionaries must not be mutated.
+    """
+    file_path = f"{manifests_dir}/components.yaml"
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        # Let the uncached loader report the missing file
+        return get_components(manifests_dir)
+    
+    key = os.path.abspath(file_path)
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _components_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    components = MappingProxyType(get_components(manifests_dir))
+    _components_cache[key] = (signature, components)
+    return components
+
+
 def get_features(manifests_dir: str = "manifests") -> Dict[str, Any]:
     """Load features manifest."""
     return load_yaml(f"{manifests_dir}/features.yaml").get("features", {})
@@ -1,5 +1,6 @@
 """Secret detection utilities for scanning files during vendor operations."""
 
+import os
 import re
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Set, Tuple
@@ -83,6 +84,42 @@ def should_exclude_file(file_path: Path, exclude_patterns: Optional[List[str]] =
     return False
 
 
+def _iter_scan_files(directory: Path, exclude_patterns: Optional[List[str]] = None):
+    """Yield regular files under directory, pruning excluded directories.
+    
+    Uses os.scandir so file/dir checks come from cached directory entries,
+    and skips descending into directories whose path matches a path pattern
+    (e.g. .git, node_modules): every file below them would match it too.
+    Suffix patterns such as '*.so' only ever apply to files.
+    """
+    if exclude_patterns is None:
+        exclude_patterns = EXCLUDE_PATTERNS
+    dir_patterns = [pattern for pattern in exclude_patterns if not pattern.startswith('*.')]
+    
+    stack = [str(directory)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        
+        subdirs = []
+        for entry in entries:
+            entry_path = Path(entry.path)
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not should_exclude_file(entry_path, dir_patterns):
+                        subdirs.append(entry.path)
+                elif entry.is_file() and not should_exclude_file(entry_path, exclude_patterns):
+                    yield entry_path
+            except OSError:
+                continue
+        
+        stack.extend(reversed(subdirs))
+
+
 def scan_file_for_secrets(file_path: Path, patterns: Optional[List[tuple]] = None) -> List[Dict[str, Any]]:
     """Scan a single file for secrets.
     
@@ -162,19 +199,15 @@ def scan_directory_for_secrets(
     files_scanned = 0
     
     try:
-        for file_path in directory.rglob('*'):
+        for file_path in _iter_scan_files(directory, exclude_patterns):
             if files_scanned >= max_files:
                 warning(f"Reached max file limit ({max_files}), stopping scan")
                 break
             
-            if should_exclude_file(file_path, exclude_patterns):
-                continue
-            
-            if file_path.is_file():
-                file_secrets = scan_file_for_secrets(file_path)
-                if file_secrets:
-                    secrets_found.extend(file_secrets)
-                files_scanned += 1
+            file_secrets = scan_file_for_secrets(file_path)
+            if file_secrets:
+                secrets_found.extend(file_secrets)
+            files_scanned += 1
     except Exception as e:
         error(f"Error scanning directory: {e}")
         return {
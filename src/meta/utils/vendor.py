@@ -1,14 +1,17 @@
 """Vendoring utilities for Linus-safe materialization."""
 
+import hashlib
+import os
 import shutil
 import subprocess
 import tempfile
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Iterable, Set
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from meta.utils.logger import log, error, success, warning
-from meta.utils.git import git_available, clone_repo, checkout_version
+from meta.utils.git import git_available, clone_repo, checkout_version, get_commit_sha
 from meta.utils.manifest import get_components, find_meta_repo_root, load_yaml, get_environment_config
 from meta.utils.dependencies import get_dependency_order
 from meta.utils.vendor_network import git_clone_with_retry, git_checkout_with_retry
@@ -20,6 +23,9 @@ from meta.utils.vendor_resume import (
 )
 
 
+VENDOR_INFO_FILE = ".vendor-info.yaml"
+
+
 def is_vendored_mode(manifests_dir: str = "manifests") -> bool:
     """Check if meta-repo is in vendored mode."""
     try:
@@ -110,6 +116,9 @@ def vendor_component(
                 else:
                     warning(f"Potential secrets detected in {name} (continuing anyway)")
         
+        # Resolve the vendored commit while the history is still there
+        commit_sha = get_commit_sha(str(tmp_path))
+        
         # Remove .git directory (we don't want git history)
         git_dir = tmp_path / ".git"
         if git_dir.exists():
@@ -148,10 +157,12 @@ def vendor_component(
             "component": name,
             "repo": repo_url,
             "version": version,
-            "vendored_at": datetime.utcnow().isoformat() + "Z"
+            "commit": commit_sha,
+            "vendored_at": datetime.utcnow().isoformat() + "Z",
+            "files": compute_file_hashes(comp_dir)
         }
         
-        vendor_info_path = comp_dir / ".vendor-info.yaml"
+        vendor_info_path = comp_dir / VENDOR_INFO_FILE
         with open(vendor_info_path, 'w') as f:
             yaml.dump(vendor_info, f, default_flow_style=False, sort_keys=False)
         
@@ -159,6 +170,52 @@ def vendor_component(
         return True
 
 
+def _hash_file(file_path: str) -> str:
+    """Compute the SHA-256 hex digest of a file.
+    
+    hashlib is backed by OpenSSL, which uses the CPU's SHA extensions when
+    available; file_digest (Python 3.11+) also avoids Python-level buffering.
+    """
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def compute_file_hashes(component_dir: Path, max_workers: int = 8) -> Dict[str, str]:
+    """Compute SHA-256 hashes for every file in a vendored component.
+    
+    Args:
+        component_dir: Path to component directory
+        max_workers: Number of hashing threads
+    
+    Returns:
+        Mapping of POSIX-style relative path to SHA-256 hex digest
+    """
+    rel_paths = []
+    for dirpath, dirnames, filenames in os.walk(component_dir):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            full_path = os.path.join(dirpath, filename)
+            rel_path = Path(os.path.relpath(full_path, component_dir)).as_posix()
+            if rel_path == VENDOR_INFO_FILE or not os.path.isfile(full_path):
+                continue
+            rel_paths.append(rel_path)
+    
+    if not rel_paths:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        digests = executor.map(
+            _hash_file,
+            (os.path.join(component_dir, rel_path) for rel_path in rel_paths)
+        )
+        return dict(zip(rel_paths, digests))
+
+
 def get_vendor_info(component_dir: Path) -> Optional[Dict[str, Any]]:
     """Get vendor information for a component.
     
@@ -168,7 +225,7 @@ def get_vendor_info(component_dir: Path) -> Optional[Dict[str, Any]]:
     Returns:
         Vendor info dict or None if not vendored
     """
-    vendor_info_path = component_dir / ".vendor-info.yaml"
+    vendor_info_path = component_dir / VENDOR_INFO_FILE
     if not vendor_info_path.exists():
         return None
     
@@ -202,6 +259,36 @@ def is_component_vendored(name: str, manifests_dir: str = "manifests") -> bool:
     return vendor_info is not None
 
 
+def get_vendored_components(names: Iterable[str], manifests_dir: str = "manifests") -> Set[str]:
+    """Return which of the given components are vendored.
+    
+    Batch form of is_component_vendored: the components directory is
+    listed once instead of stat-ing each component separately.
+    
+    Args:
+        names: Component names to check
+        manifests_dir: Manifests directory
+    
+    Returns:
+        Set of vendored component names
+    """
+    root = find_meta_repo_root()
+    if not root:
+        return set()
+    
+    wanted = set(names)
+    vendored = set()
+    try:
+        with os.scandir(root / "components") as it:
+            for entry in it:
+                if (entry.name in wanted and entry.is_dir()
+                        and get_vendor_info(Path(entry.path)) is not None):
+                    vendored.add(entry.name)
+    except FileNotFoundError:
+        pass
+    return vendored
+
+
 def convert_to_vendored_mode(
     manifests_dir: str = "manifests",
     force: bool = False
@@ -663,17 +750,19 @@ def convert_to_vendored_mode_enhanced(
     
     # Atomic conversion wrapper
     def do_conversion():
-        return convert_to_vendored_mode_internal(
-            manifests_dir=manifests_dir,
-            force=force,
-            continue_on_error=continue_on_error,
-            check_secrets=check_secrets,
-            fail_on_secrets=fail_on_secrets,
-            respect_gitignore=respect_gitignore,
-            results=results,
-            checkpoint=checkpoint,
-            changeset=changeset
-        )
+        # The checkpoint context writes a final snapshot however conversion ends
+        with checkpoint:
+            return convert_to_vendored_mode_internal(
+                manifests_dir=manifests_dir,
+                force=force,
+                continue_on_error=continue_on_error,
+                check_secrets=check_secrets,
+                fail_on_secrets=fail_on_secrets,
+                respect_gitignore=respect_gitignore,
+                results=results,
+                checkpoint=checkpoint,
+                changeset=changeset
+            )
     
     if atomic and not resume:
         log("Executing atomic conversion...")
@@ -724,8 +813,9 @@ def convert_to_vendored_mode_internal(
     
     # Get dependency order
     if checkpoint:
-        # Use pending components from checkpoint
-        dep_order = checkpoint.pending_components
+        # Use pending components from checkpoint (copied, since completing
+        # a component removes it from the checkpoint's pending list)
+        dep_order = list(checkpoint.pending_components)
         log(f"Resuming conversion: {len(dep_order)} components remaining")
     else:
         dep_order = get_dependency_order(components)
@@ -778,7 +868,8 @@ def convert_to_vendored_mode_internal(
         if success_result:
             results['successful'].append(name)
             if checkpoint:
-                checkpoint.mark_completed(name)
+                vendor_info = get_vendor_info(comp_dir) or {}
+                checkpoint.append_completed(name, sha=vendor_info.get("commit"))
             
             # Record in changeset if available
             if changeset:
@@ -876,6 +967,27 @@ def verify_conversion(
             results['errors'].append(f"Component {name} version mismatch: expected {expected_version}, got {actual_version}")
             continue
         
+        # Check file hashes recorded at vendor time (older vendor info has none)
+        expected_files = vendor_info.get("files")
+        if check_integrity and expected_files is not None:
+            actual_files = compute_file_hashes(comp_dir)
+            modified = sorted(
+                path for path, digest in expected_files.items()
+                if path in actual_files and actual_files[path] != digest
+            )
+            missing = sorted(set(expected_files) - set(actual_files))
+            added = sorted(set(actual_files) - set(expected_files))
+            if modified or missing or added:
+                results['valid'] = False
+                results['components_invalid'] += 1
+                for path in modified:
+                    results['errors'].append(f"Component {name} file modified: {path}")
+                for path in missing:
+                    results['errors'].append(f"Component {name} file missing: {path}")
+                for path in added:
+                    results['errors'].append(f"Component {name} unexpected file: {path}")
+                continue
+        
         results['components_valid'] += 1
     
     return results['valid'], results
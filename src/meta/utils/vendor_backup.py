@@ -1,27 +1,400 @@
 """Backup and restore utilities for vendor conversions."""
 
+import errno
+import os
+import stat
+import sys
 import shutil
 import yaml
-import json
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Set, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from meta.utils.logger import log, error, success, warning
 from meta.utils.manifest import find_meta_repo_root, load_yaml
+from meta.utils.json_io import dump_json, load_json, file_signature
 
 
 BACKUP_DIR = Path(".meta/backups")
+# Deep-copying (no reflink/hardlink) more than this requires force_deep_copy
+BACKUP_DEEP_COPY_LIMIT_BYTES = 5_000_000_000
+
+# Backup directory -> (metadata file signature, listing data)
+_listing_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _copy_file_data(src: str, dst: str, size: int):
+    """Copy file contents using the fastest available platform path."""
+    if sys.platform.startswith("linux"):
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    elif sys.platform == "win32":
+        import ctypes
+        if not ctypes.windll.kernel32.CopyFileW(src, dst, False):
+            raise ctypes.WinError()
+    else:
+        shutil.copyfile(src, dst)
+
+
+def _copy_file(src: str, dst: str, st: os.stat_result):
+    """Copy a single file, reusing an already-fetched stat result."""
+    try:
+        _copy_file_data(src, dst, st.st_size)
+    except OSError:
+        # e.g. sendfile unsupported on this filesystem
+        shutil.copyfile(src, dst)
+    os.chmod(dst, st.st_mode & 0o7777)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _fast_copytree(
+    src: Path,
+    dst: Path,
+    ignore: Optional[Callable[[str, List[str]], Set[str]]] = None,
+    workers: int = 16
+):
+    """Copy a directory tree, copying files concurrently.
+    
+    Drop-in replacement for shutil.copytree (default arguments). The tree is
+    walked with os.scandir so each file is stat'ed once, and file copies are
+    dispatched to a thread pool to overlap syscall latency.
+    
+    Args:
+        src: Source directory
+        dst: Destination directory (must not exist)
+        ignore: Optional shutil.copytree-style ignore callable
+        workers: Number of copy threads
+    """
+    copied_dirs = []
+    futures = []
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        stack = [(str(src), str(dst))]
+        while stack:
+            src_dir, dst_dir = stack.pop()
+            os.makedirs(dst_dir)
+            copied_dirs.append((src_dir, dst_dir))
+            
+            with os.scandir(src_dir) as it:
+                entries = list(it)
+            
+            ignored = ignore(src_dir, [e.name for e in entries]) if ignore else set()
+            for entry in entries:
+                if entry.name in ignored:
+                    continue
+                dst_path = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    stack.append((entry.path, dst_path))
+                else:
+                    futures.append(
+                        executor.submit(_copy_file, entry.path, dst_path, entry.stat())
+                    )
+        
+        for future in futures:
+            future.result()
+    
+    # Directory metadata last, since populating a directory changes its mtime
+    for src_dir, dst_dir in reversed(copied_dirs):
+        shutil.copystat(src_dir, dst_dir)
+
+
+def _estimate_tree(
+    src: Path,
+    ignore: Optional[Callable[[str, List[str]], Set[str]]] = None
+) -> Tuple[int, int]:
+    """Count the files and total bytes a copy of src would write.
+    
+    Args:
+        src: Source directory
+        ignore: Optional shutil.copytree-style ignore callable
+    
+    Returns:
+        Tuple of (file count, total size in bytes)
+    """
+    files = 0
+    total = 0
+    stack = [str(src)]
+    while stack:
+        src_dir = stack.pop()
+        with os.scandir(src_dir) as it:
+            entries = list(it)
+        
+        ignored = ignore(src_dir, [e.name for e in entries]) if ignore else set()
+        for entry in entries:
+            if entry.name in ignored:
+                continue
+            if entry.is_dir():
+                stack.append(entry.path)
+            else:
+                files += 1
+                total += entry.stat().st_size
+    return files, total
+
+
+def _unlink(file_path: str):
+    """Remove a file, clearing the read-only bit on Windows if needed."""
+    try:
+        os.unlink(file_path)
+    except PermissionError:
+        if sys.platform != "win32":
+            raise
+        # Git marks object files read-only, which blocks deletion on Windows
+        os.chmod(file_path, stat.S_IWRITE)
+        os.unlink(file_path)
+
+
+def _fast_rmtree(path: Path, workers: int = 16):
+    """Delete a directory tree.
+    
+    Replacement for shutil.rmtree that walks with os.scandir and decides
+    file vs directory from the cached directory entry, so no entry is
+    lstat'ed again. Files are unlinked concurrently; directories are
+    removed bottom-up once their contents are gone.
+    
+    Args:
+        path: Directory to remove
+        workers: Number of unlink threads
+    """
+    dirs = []
+    futures = []
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        stack = [str(path)]
+        while stack:
+            current = stack.pop()
+            dirs.append(current)
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        futures.append(executor.submit(_unlink, entry.path))
+        
+        for future in futures:
+            future.result()
+    
+    # Children were appended after their parents, so reverse order is bottom-up
+    for dir_path in reversed(dirs):
+        try:
+            os.rmdir(dir_path)
+        except PermissionError:
+            if sys.platform != "win32":
+                raise
+            os.chmod(dir_path, stat.S_IWRITE)
+            os.rmdir(dir_path)
+
+
+# Errors meaning "this filesystem/platform can't clone", as opposed to real failures
+_REFLINK_UNSUPPORTED = {
+    errno.EXDEV, errno.EINVAL, errno.ENOTTY, errno.ENOSYS,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP), errno.EOPNOTSUPP,
+}
+_FICLONE = 0x40049409
+_CLONE_NOFOLLOW = 0x0001
+_libsystem = None
+
+
+def _darwin_clonefile(src: str, dst: str):
+    """Clone a file or directory tree with macOS clonefile(2)."""
+    global _libsystem
+    import ctypes
+    if _libsystem is None:
+        _libsystem = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True)
+    if _libsystem.clonefile(os.fsencode(src), os.fsencode(dst), _CLONE_NOFOLLOW) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), src)
+
+
+def _reflink_file(src: str, dst: str, st: os.stat_result):
+    """Clone a single file's extents (copy-on-write), preserving metadata."""
+    if sys.platform == "darwin":
+        _darwin_clonefile(src, dst)
+        return
+    if not sys.platform.startswith("linux"):
+        # ReFS block cloning (FSCTL_DUPLICATE_EXTENTS_TO_FILE) is not supported
+        raise OSError(errno.EOPNOTSUPP, "reflink not supported on this platform", src)
+    
+    import fcntl
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    os.chmod(dst, st.st_mode & 0o7777)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _link_tree(
+    src: Path,
+    dst: Path,
+    link_file: Callable[[str, str, os.stat_result], None],
+    ignore: Optional[Callable[[str, List[str]], Set[str]]] = None
+):
+    """Recreate src's directories under dst, calling link_file for each file."""
+    copied_dirs = []
+    stack = [(str(src), str(dst))]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        os.makedirs(dst_dir)
+        copied_dirs.append((src_dir, dst_dir))
+        
+        with os.scandir(src_dir) as it:
+            entries = list(it)
+        
+        ignored = ignore(src_dir, [e.name for e in entries]) if ignore else set()
+        for entry in entries:
+            if entry.name in ignored:
+                continue
+            dst_path = os.path.join(dst_dir, entry.name)
+            if entry.is_dir():
+                stack.append((entry.path, dst_path))
+            else:
+                link_file(entry.path, dst_path, entry.stat())
+    
+    for src_dir, dst_dir in reversed(copied_dirs):
+        shutil.copystat(src_dir, dst_dir)
+
+
+def _try_reflink_tree(
+    src: Path,
+    dst: Path,
+    ignore: Optional[Callable[[str, List[str]], Set[str]]] = None
+) -> bool:
+    """Try to snapshot a directory tree with copy-on-write clones.
+    
+    On macOS without an ignore filter the whole tree is cloned in one
+    clonefile(2) call; otherwise files are cloned one by one (FICLONE on
+    Linux Btrfs/XFS, clonefile on APFS). No file data is copied.
+    
+    Args:
+        src: Source directory
+        dst: Destination directory (must not exist)
+        ignore: Optional shutil.copytree-style ignore callable
+    
+    Returns:
+        True if the tree was cloned, False if the filesystem or platform
+        does not support it (dst is removed again in that case)
+    """
+    try:
+        if sys.platform == "darwin" and ignore is None:
+            _darwin_clonefile(str(src), str(dst))
+            return True
+        _link_tree(src, dst, _reflink_file, ignore=ignore)
+        return True
+    except OSError as e:
+        if e.errno not in _REFLINK_UNSUPPORTED:
+            raise
+        if dst.exists():
+            _fast_rmtree(dst)
+        return False
+
+
+# Errors meaning "can't hardlink here" (other device, FAT/exFAT, link limit)
+_HARDLINK_UNSUPPORTED = {
+    errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOSYS,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP), errno.EOPNOTSUPP,
+}
+
+
+def _hardlink_file(src: str, dst: str, st: os.stat_result):
+    """Hardlink a single file (metadata is shared with the source inode)."""
+    os.link(src, dst)
+
+
+def _try_hardlink_tree(
+    src: Path,
+    dst: Path,
+    ignore: Optional[Callable[[str, List[str]], Set[str]]] = None
+) -> bool:
+    """Try to snapshot a directory tree as hardlinks to the source files.
+    
+    Only directory entries are created; file data and inodes are shared
+    with src. This is only safe while src files are replaced rather than
+    edited in place (git checkout and vendoring both write new files).
+    
+    Args:
+        src: Source directory
+        dst: Destination directory (must not exist)
+        ignore: Optional shutil.copytree-style ignore callable
+    
+    Returns:
+        True if the tree was linked, False if src and dst are on different
+        filesystems or the filesystem has no hardlinks (dst is removed
+        again in that case)
+    """
+    try:
+        _link_tree(src, dst, _hardlink_file, ignore=ignore)
+        return True
+    except OSError as e:
+        if e.errno not in _HARDLINK_UNSUPPORTED:
+            raise
+        if dst.exists():
+            _fast_rmtree(dst)
+        return False
+
+
+def _snapshot_tree(
+    src: Path,
+    dst: Path,
+    ignore: Optional[Callable[[str, List[str]], Set[str]]] = None,
+    hardlink: bool = False,
+    copy_limit: Optional[int] = None
+) -> Optional[Dict[str, bool]]:
+    """Snapshot src to dst, cloning where possible and copying otherwise.
+    
+    Args:
+        src: Source directory
+        dst: Destination directory (must not exist)
+        ignore: Optional shutil.copytree-style ignore callable
+        hardlink: Fall back to hardlinks before copying when cloning fails
+        copy_limit: Largest tree, in bytes, to deep-copy as the last resort;
+            None copies any size. Only the deep-copy path sizes the tree.
+    
+    Returns:
+        Dictionary describing how the snapshot was made, or None if it
+        would have needed a deep copy of more than copy_limit bytes
+    """
+    if _try_reflink_tree(src, dst, ignore=ignore):
+        return {'reflinked': True, 'hardlinked': False}
+    if hardlink and _try_hardlink_tree(src, dst, ignore=ignore):
+        return {'reflinked': False, 'hardlinked': True}
+    if copy_limit is not None:
+        files, total_bytes = _estimate_tree(src, ignore=ignore)
+        log(f"  Deep-copying {files} files, {total_bytes / 1e9:.2f} GB")
+        if total_bytes > copy_limit:
+            return None
+    _fast_copytree(src, dst, ignore=ignore)
+    return {'reflinked': False, 'hardlinked': False}
 
 
 def create_backup(
     backup_name: Optional[str] = None,
-    include_components: bool = True
+    include_components: bool = True,
+    force_deep_copy: bool = False
 ) -> Optional[Path]:
     """Create a backup of the current meta-repo state.
     
     Args:
         backup_name: Optional name for backup (defaults to timestamp)
         include_components: Whether to backup components directory
+        force_deep_copy: Allow deep-copying components larger than
+            BACKUP_DEEP_COPY_LIMIT_BYTES when they cannot be cloned or linked
     
     Returns:
         Path to backup directory, or None if failed
@@ -51,8 +424,9 @@ def create_backup(
     # Backup manifests
     manifests_src = root / "manifests"
     manifests_dst = backup_path / "manifests"
+    snapshots = []
     if manifests_src.exists():
-        shutil.copytree(manifests_src, manifests_dst)
+        snapshots.append(_snapshot_tree(manifests_src, manifests_dst))
         log("  ✓ Backed up manifests")
     
     # Backup components (if requested)
@@ -61,8 +435,22 @@ def create_backup(
         components_dst = backup_path / "components"
         if components_src.exists():
             # For large components, we might want to skip git repos
-            # and only backup vendored source
-            shutil.copytree(components_src, components_dst, ignore=shutil.ignore_patterns('.git'))
+            # and only backup vendored source. Component files are replaced,
+            # never edited in place, so a hardlinked snapshot stays intact.
+            ignore = shutil.ignore_patterns('.git')
+            copy_limit = None if force_deep_copy else BACKUP_DEEP_COPY_LIMIT_BYTES
+            snapshot = _snapshot_tree(
+                components_src, components_dst,
+                ignore=ignore, hardlink=True, copy_limit=copy_limit
+            )
+            if snapshot is None:
+                error(
+                    f"Components tree is over {BACKUP_DEEP_COPY_LIMIT_BYTES / 1e9:.0f} GB and "
+                    f"cannot be cloned or hardlinked here; rerun with --force-deep-copy to copy it"
+                )
+                _fast_rmtree(backup_path)
+                return None
+            snapshots.append(snapshot)
             log("  ✓ Backed up components")
     
     # Create backup metadata
@@ -72,12 +460,13 @@ def create_backup(
         'meta_repo_root': str(root),
         'includes_components': include_components,
         'manifests_backed_up': manifests_src.exists(),
-        'components_backed_up': include_components and (root / "components").exists()
+        'components_backed_up': include_components and (root / "components").exists(),
+        'reflinked': bool(snapshots) and all(snap['reflinked'] for snap in snapshots),
+        'hardlinked': any(snap['hardlinked'] for snap in snapshots)
     }
     
     metadata_path = backup_path / "backup_metadata.json"
-    with open(metadata_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    dump_json(metadata, metadata_path)
     
     success(f"Backup created: {backup_path}")
     return backup_path
@@ -86,6 +475,9 @@ def create_backup(
 def list_backups() -> List[Dict[str, Any]]:
     """List all available backups.
     
+    Parsed metadata is cached on the metadata file's (mtime, size), so
+    unchanged backups are not re-read on later calls.
+    
     Returns:
         List of backup metadata dictionaries
     """
@@ -93,32 +485,60 @@ def list_backups() -> List[Dict[str, Any]]:
         return []
     
     backups = []
-    for backup_path in BACKUP_DIR.iterdir():
-        if not backup_path.is_dir():
-            continue
-        
+    with os.scandir(BACKUP_DIR) as it:
+        backup_entries = [entry for entry in it if entry.is_dir()]
+    
+    seen = set()
+    for entry in backup_entries:
+        backup_path = Path(entry.path)
         metadata_path = backup_path / "backup_metadata.json"
-        if metadata_path.exists():
-            try:
-                with open(metadata_path, 'r') as f:
-                    metadata = json.load(f)
-                    metadata['path'] = str(backup_path)
-                    backups.append(metadata)
-            except Exception as e:
-                warning(f"Failed to read backup metadata for {backup_path}: {e}")
-        else:
+        signature = file_signature(str(metadata_path))
+        if signature is None:
             # Legacy backup without metadata
             backups.append({
-                'backup_name': backup_path.name,
+                'backup_name': entry.name,
                 'path': str(backup_path),
                 'created_at': 'unknown'
             })
+            continue
+        
+        cache_key = os.path.abspath(entry.path)
+        seen.add(cache_key)
+        cached = _listing_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            backups.append(dict(cached[1]))
+            continue
+        
+        try:
+            metadata = load_json(metadata_path)
+            metadata['path'] = str(backup_path)
+            _listing_cache[cache_key] = (signature, metadata)
+            backups.append(dict(metadata))
+        except FileNotFoundError:
+            # Removed while listing
+            continue
+        except Exception as e:
+            warning(f"Failed to read backup metadata for {backup_path}: {e}")
+    
+    for stale in _listing_cache.keys() - seen:
+        del _listing_cache[stale]
     
     # Sort by creation time (newest first)
     backups.sort(key=lambda x: x.get('created_at', ''), reverse=True)
     return backups
 
 
+def _restore_tree(src: Path, dst: Path, metadata: Dict[str, Any]):
+    """Restore a backed-up tree, cloning it back if the backup was cloned.
+    
+    Hardlinked backups are always copied back, so later edits to the
+    restored tree cannot reach into the backup.
+    """
+    if metadata.get('reflinked') and _try_reflink_tree(src, dst):
+        return
+    _fast_copytree(src, dst)
+
+
 def restore_backup(
     backup_name: str,
     restore_components: bool = True
@@ -149,8 +569,7 @@ def restore_backup(
     metadata = {}
     if metadata_path.exists():
         try:
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
+            metadata = load_json(metadata_path)
         except Exception as e:
             warning(f"Failed to read backup metadata: {e}")
     
@@ -159,8 +578,8 @@ def restore_backup(
     manifests_dst = root / "manifests"
     if manifests_src.exists():
         if manifests_dst.exists():
-            shutil.rmtree(manifests_dst)
-        shutil.copytree(manifests_src, manifests_dst)
+            _fast_rmtree(manifests_dst)
+        _restore_tree(manifests_src, manifests_dst, metadata)
         log("  ✓ Restored manifests")
     
     # Restore components (if requested)
@@ -169,8 +588,8 @@ def restore_backup(
         components_dst = root / "components"
         if components_src.exists():
             if components_dst.exists():
-                shutil.rmtree(components_dst)
-            shutil.copytree(components_src, components_dst)
+                _fast_rmtree(components_dst)
+            _restore_tree(components_src, components_dst, metadata)
             log("  ✓ Restored components")
     
     success(f"Restored from backup: {backup_name}")
@@ -1,19 +1,61 @@
 """Conversion resume utilities for recovering from interrupted conversions."""
 
 import json
+import os
+import time
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Set
+from typing import Dict, Any, Optional, List, Set, Iterable, Tuple
 from datetime import datetime
 from meta.utils.logger import log, error, success, warning
-from meta.utils.manifest import find_meta_repo_root, get_components
+from meta.utils.manifest import find_meta_repo_root, get_components_cached
+from meta.utils.json_io import dump_json, load_json, dumps_json, loads_json, file_signature
 
 
 RESUME_DIR = Path(".meta/resume")
+CHECKPOINT_FILE = "checkpoint.json"
+CHECKPOINT_LOG = "checkpoint.log"
+# Journal fsyncs are batched: every this many records...
+CHECKPOINT_SYNC_INTERVAL = 8
+# ...or once this many seconds have passed since the last fsync
+CHECKPOINT_SYNC_SECONDS = 1.0
+# Compact the journal once it holds this many records per tracked component
+CHECKPOINT_COMPACT_RATIO = 10
+
+_OP_COMPLETED = "c"
+_OP_FAILED = "f"
+
+# Checkpoint directory -> ((snapshot signature, journal signature), listing data)
+_listing_cache: Dict[str, Tuple[Tuple[Any, Any], Dict[str, Any]]] = {}
+
+STATE_COMPLETED = "completed"
+STATE_FAILED = "failed"
+STATE_PENDING = "pending"
+
+
+def _read_journal(log_file: Path):
+    """Yield journal records, skipping a torn trailing write."""
+    try:
+        f = open(log_file, 'rb')
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            try:
+                record = loads_json(line)
+            except json.JSONDecodeError:
+                # Torn trailing write from an interrupted run
+                continue
+            if record.get('n'):
+                yield record
 
 
 class ConversionCheckpoint:
-    """Represents a conversion checkpoint for resuming."""
+    """Represents a conversion checkpoint for resuming.
+    
+    State is persisted as a snapshot (checkpoint.json) plus an append-only
+    journal (checkpoint.log) of component transitions since that snapshot.
+    """
     
     def __init__(
         self,
@@ -26,65 +68,225 @@ class ConversionCheckpoint:
         self.manifests_dir = manifests_dir
         self.checkpoint_dir = RESUME_DIR / checkpoint_id
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
-        self.completed_components: Set[str] = set()
-        self.failed_components: Set[str] = set()
-        self.pending_components: List[str] = []
+        # Component name -> STATE_*; insertion order is the conversion order
+        self.state: Dict[str, str] = {}
+        self.counts: Dict[str, int] = {STATE_COMPLETED: 0, STATE_FAILED: 0, STATE_PENDING: 0}
         self.created_at = datetime.utcnow().isoformat() + "Z"
+        self._log_fd: Optional[int] = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._journal_records = 0
+    
+    def __enter__(self) -> "ConversionCheckpoint":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Always leave a complete snapshot behind, even if conversion raised
+        self.save()
+        return False
+    
+    def _set_state(self, component_name: str, new_state: str):
+        """Move a component to a new state, keeping counts in step."""
+        old_state = self.state.get(component_name)
+        if old_state is not None:
+            self.counts[old_state] -= 1
+            if new_state == STATE_PENDING:
+                # Re-queued components go to the back of the pending order
+                del self.state[component_name]
+        self.state[component_name] = new_state
+        self.counts[new_state] += 1
+    
+    def _names_in(self, wanted: str) -> List[str]:
+        return [name for name, current in self.state.items() if current == wanted]
+    
+    def _replace_state(self, wanted: str, names):
+        for name in self._names_in(wanted):
+            del self.state[name]
+            self.counts[wanted] -= 1
+        for name in names:
+            self._set_state(name, wanted)
+    
+    @property
+    def completed_components(self) -> Set[str]:
+        """Names of completed components."""
+        return set(self._names_in(STATE_COMPLETED))
+    
+    @completed_components.setter
+    def completed_components(self, names):
+        self._replace_state(STATE_COMPLETED, names)
+    
+    @property
+    def failed_components(self) -> Set[str]:
+        """Names of failed components."""
+        return set(self._names_in(STATE_FAILED))
+    
+    @failed_components.setter
+    def failed_components(self, names):
+        self._replace_state(STATE_FAILED, names)
+    
+    @property
+    def pending_components(self) -> List[str]:
+        """Names of pending components, in conversion order."""
+        return self._names_in(STATE_PENDING)
+    
+    @pending_components.setter
+    def pending_components(self, names):
+        self._replace_state(STATE_PENDING, names)
+    
+    def mark_pending(self, component_name: str):
+        """Queue a component for (re)conversion."""
+        self._set_state(component_name, STATE_PENDING)
     
     def save(self):
-        """Save checkpoint to disk."""
+        """Save a full checkpoint snapshot to disk.
+        
+        The snapshot supersedes the journal, which is removed once the
+        snapshot has been written.
+        """
+        by_state: Dict[str, List[str]] = {STATE_COMPLETED: [], STATE_FAILED: [], STATE_PENDING: []}
+        for name, current in self.state.items():
+            by_state[current].append(name)
+        
         checkpoint_data = {
             'checkpoint_id': self.checkpoint_id,
             'target_mode': self.target_mode,
             'manifests_dir': self.manifests_dir,
             'created_at': self.created_at,
-            'completed_components': list(self.completed_components),
-            'failed_components': list(self.failed_components),
-            'pending_components': self.pending_components
+            'completed_components': by_state[STATE_COMPLETED],
+            'failed_components': by_state[STATE_FAILED],
+            'pending_components': by_state[STATE_PENDING]
         }
         
-        checkpoint_file = self.checkpoint_dir / "checkpoint.json"
-        with open(checkpoint_file, 'w') as f:
-            json.dump(checkpoint_data, f, indent=2)
+        checkpoint_file = self.checkpoint_dir / CHECKPOINT_FILE
+        dump_json(checkpoint_data, checkpoint_file, durable=True)
+        
+        self._close_log()
+        log_file = self.checkpoint_dir / CHECKPOINT_LOG
+        if log_file.exists():
+            log_file.unlink()
+        self._journal_records = 0
+    
+    def compact(self):
+        """Fold the journal into the snapshot once it has grown large."""
+        if self._journal_records > CHECKPOINT_COMPACT_RATIO * max(len(self.state), 1):
+            self.save()
+    
+    def _append(self, record: Dict[str, Any]):
+        """Append one record to the journal.
+        
+        The journal is fsynced every CHECKPOINT_SYNC_INTERVAL records or
+        CHECKPOINT_SYNC_SECONDS seconds, whichever comes first; call
+        sync_log() or save() to persist the remainder.
+        """
+        if self._log_fd is None:
+            log_file = self.checkpoint_dir / CHECKPOINT_LOG
+            self._log_fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            size = os.fstat(self._log_fd).st_size
+            if size:
+                # A torn write from an interrupted run leaves no trailing
+                # newline; start a fresh line so the next record stays parseable
+                with open(log_file, 'rb') as f:
+                    f.seek(size - 1)
+                    if f.read(1) != b"\n":
+                        os.write(self._log_fd, b"\n")
+        os.write(self._log_fd, dumps_json(record) + b"\n")
+        self._journal_records += 1
+        
+        self._unsynced += 1
+        if (self._unsynced >= CHECKPOINT_SYNC_INTERVAL
+                or time.monotonic() - self._last_sync > CHECKPOINT_SYNC_SECONDS):
+            self.sync_log()
+        self.compact()
+    
+    def sync_log(self):
+        """Flush pending journal records to stable storage."""
+        if self._log_fd is not None and self._unsynced:
+            os.fsync(self._log_fd)
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+    
+    def _close_log(self):
+        """Sync and close the journal if it is open."""
+        if self._log_fd is not None:
+            self.sync_log()
+            os.close(self._log_fd)
+            self._log_fd = None
+    
+    def _apply_completed(self, component_name: str):
+        self._set_state(component_name, STATE_COMPLETED)
+    
+    def _apply_failed(self, component_name: str):
+        self._set_state(component_name, STATE_FAILED)
+    
+    def replay_log(self):
+        """Apply journal records written since the last snapshot."""
+        for record in _read_journal(self.checkpoint_dir / CHECKPOINT_LOG):
+            if record.get('op') == _OP_FAILED:
+                self._apply_failed(record['n'])
+            else:
+                self._apply_completed(record['n'])
+            self._journal_records += 1
+    
+    def append_completed(self, component_name: str, sha: Optional[str] = None):
+        """Mark a component as completed, recording the SHA it was vendored from.
+        
+        Args:
+            component_name: Component name
+            sha: Optional commit SHA the component was vendored from
+        """
+        self._apply_completed(component_name)
+        self._append({
+            'op': _OP_COMPLETED,
+            'n': component_name,
+            'sha': sha,
+            'ts': datetime.utcnow().isoformat() + "Z"
+        })
     
     def mark_completed(self, component_name: str):
         """Mark a component as completed."""
-        self.completed_components.add(component_name)
-        if component_name in self.pending_components:
-            self.pending_components.remove(component_name)
-        if component_name in self.failed_components:
-            self.failed_components.remove(component_name)
-        self.save()
+        self.append_completed(component_name)
     
     def mark_failed(self, component_name: str):
         """Mark a component as failed."""
-        self.failed_components.add(component_name)
-        if component_name in self.pending_components:
-            self.pending_components.remove(component_name)
-        if component_name in self.completed_components:
-            self.completed_components.remove(component_name)
-        self.save()
+        self._apply_failed(component_name)
+        self._append({'op': _OP_FAILED, 'n': component_name})
     
     def is_completed(self, component_name: str) -> bool:
         """Check if a component is already completed."""
-        return component_name in self.completed_components
+        return self.state.get(component_name) == STATE_COMPLETED
     
     def is_failed(self, component_name: str) -> bool:
         """Check if a component previously failed."""
-        return component_name in self.failed_components
+        return self.state.get(component_name) == STATE_FAILED
     
     def get_progress(self) -> Dict[str, Any]:
         """Get conversion progress."""
-        total = len(self.completed_components) + len(self.failed_components) + len(self.pending_components)
+        completed = self.counts[STATE_COMPLETED]
+        total = completed + self.counts[STATE_FAILED] + self.counts[STATE_PENDING]
         return {
             'total': total,
-            'completed': len(self.completed_components),
-            'failed': len(self.failed_components),
-            'pending': len(self.pending_components),
-            'progress_percent': (len(self.completed_components) / total * 100) if total > 0 else 0
+            'completed': completed,
+            'failed': self.counts[STATE_FAILED],
+            'pending': self.counts[STATE_PENDING],
+            'progress_percent': (completed / total * 100) if total > 0 else 0
         }
 
 
+def _components_with_git(components_dir: Path, names: Iterable[str]) -> Set[str]:
+    """Return which of the named component directories are git checkouts."""
+    wanted = set(names)
+    with_git = set()
+    try:
+        with os.scandir(components_dir) as it:
+            for entry in it:
+                if (entry.name in wanted and entry.is_dir()
+                        and os.path.exists(os.path.join(entry.path, ".git"))):
+                    with_git.add(entry.name)
+    except FileNotFoundError:
+        pass
+    return with_git
+
+
 def create_checkpoint(
     target_mode: str,
     manifests_dir: str = "manifests",
@@ -109,26 +311,23 @@ def create_checkpoint(
     checkpoint = ConversionCheckpoint(checkpoint_id, target_mode, manifests_dir)
     
     # Initialize with all components as pending
-    components = get_components(manifests_dir)
+    components = get_components_cached(manifests_dir)
     root = find_meta_repo_root()
     
     if root:
         # Check which components are already converted
-        # Import here to avoid circular import
-        from meta.utils.vendor import is_component_vendored
+        if target_mode == "vendored":
+            # Import here to avoid circular import
+            from meta.utils.vendor import get_vendored_components
+            converted = get_vendored_components(components, manifests_dir)
+        else:  # reference mode
+            converted = _components_with_git(root / "components", components)
         
-        for name in components.keys():
-            if target_mode == "vendored":
-                if is_component_vendored(name, manifests_dir):
-                    checkpoint.completed_components.add(name)
-                else:
-                    checkpoint.pending_components.append(name)
-            else:  # reference mode
-                comp_dir = root / "components" / name
-                if comp_dir.exists() and (comp_dir / ".git").exists():
-                    checkpoint.completed_components.add(name)
-                else:
-                    checkpoint.pending_components.append(name)
+        for name in components:
+            if name in converted:
+                checkpoint._set_state(name, STATE_COMPLETED)
+            else:
+                checkpoint.mark_pending(name)
     
     checkpoint.save()
     return checkpoint
@@ -144,14 +343,13 @@ def load_checkpoint(checkpoint_id: str) -> Optional[ConversionCheckpoint]:
         ConversionCheckpoint instance or None if not found
     """
     checkpoint_dir = RESUME_DIR / checkpoint_id
-    checkpoint_file = checkpoint_dir / "checkpoint.json"
+    checkpoint_file = checkpoint_dir / CHECKPOINT_FILE
     
     if not checkpoint_file.exists():
         return None
     
     try:
-        with open(checkpoint_file, 'r') as f:
-            data = json.load(f)
+        data = load_json(checkpoint_file)
         
         checkpoint = ConversionCheckpoint(
             data['checkpoint_id'],
@@ -162,6 +360,7 @@ def load_checkpoint(checkpoint_id: str) -> Optional[ConversionCheckpoint]:
         checkpoint.completed_components = set(data.get('completed_components', []))
         checkpoint.failed_components = set(data.get('failed_components', []))
         checkpoint.pending_components = data.get('pending_components', [])
+        checkpoint.replay_log()
         
         return checkpoint
     except Exception as e:
@@ -169,9 +368,35 @@ def load_checkpoint(checkpoint_id: str) -> Optional[ConversionCheckpoint]:
         return None
 
 
+def _replay_journal_into(data: Dict[str, Any], log_file: Path):
+    """Apply journal records to a raw checkpoint snapshot dictionary."""
+    completed = set(data.get('completed_components', []))
+    failed = set(data.get('failed_components', []))
+    pending = data.get('pending_components', [])
+    changed = set()
+    
+    for record in _read_journal(log_file):
+        name = record['n']
+        changed.add(name)
+        if record.get('op') == _OP_FAILED:
+            failed.add(name)
+            completed.discard(name)
+        else:
+            completed.add(name)
+            failed.discard(name)
+    
+    if changed:
+        data['completed_components'] = list(completed)
+        data['failed_components'] = list(failed)
+        data['pending_components'] = [name for name in pending if name not in changed]
+
+
 def list_checkpoints() -> List[Dict[str, Any]]:
     """List all available checkpoints.
     
+    Parsed checkpoints are cached on the (mtime, size) of their snapshot and
+    journal, so unchanged checkpoints are not re-read on later calls.
+    
     Returns:
         List of checkpoint metadata dictionaries
     """
@@ -179,19 +404,41 @@ def list_checkpoints() -> List[Dict[str, Any]]:
         return []
     
     checkpoints = []
-    for checkpoint_dir in RESUME_DIR.iterdir():
-        if not checkpoint_dir.is_dir():
+    with os.scandir(RESUME_DIR) as it:
+        checkpoint_entries = [entry for entry in it if entry.is_dir()]
+    
+    seen = set()
+    for entry in checkpoint_entries:
+        checkpoint_dir = Path(entry.path)
+        # Stat before reading, so a concurrent update can only make the
+        # cached signature stale (forcing a re-read), never the data
+        snapshot_sig = file_signature(os.path.join(entry.path, CHECKPOINT_FILE))
+        if snapshot_sig is None:
+            # Directory without a snapshot (e.g. created but never saved)
             continue
+        signature = (snapshot_sig, file_signature(os.path.join(entry.path, CHECKPOINT_LOG)))
+        cache_key = os.path.abspath(entry.path)
+        seen.add(cache_key)
         
-        checkpoint_file = checkpoint_dir / "checkpoint.json"
-        if checkpoint_file.exists():
-            try:
-                with open(checkpoint_file, 'r') as f:
-                    data = json.load(f)
-                    data['path'] = str(checkpoint_dir)
-                    checkpoints.append(data)
-            except Exception as e:
-                warning(f"Failed to read checkpoint {checkpoint_dir.name}: {e}")
+        cached = _listing_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            checkpoints.append(dict(cached[1]))
+            continue
+        
+        try:
+            data = load_json(checkpoint_dir / CHECKPOINT_FILE)
+            _replay_journal_into(data, checkpoint_dir / CHECKPOINT_LOG)
+            data['path'] = str(checkpoint_dir)
+            _listing_cache[cache_key] = (signature, data)
+            checkpoints.append(dict(data))
+        except FileNotFoundError:
+            # Removed while listing
+            continue
+        except Exception as e:
+            warning(f"Failed to read checkpoint {entry.name}: {e}")
+    
+    for stale in _listing_cache.keys() - seen:
+        del _listing_cache[stale]
     
     # Sort by creation time (newest first)
     checkpoints.sort(key=lambda x: x.get('created_at', ''), reverse=True)
@@ -241,13 +488,13 @@ def resume_conversion(
     log(f"Progress: {progress['completed']}/{progress['total']} completed ({progress['progress_percent']:.1f}%)")
     
     if skip_completed:
-        log(f"Skipping {len(checkpoint.completed_components)} already completed components")
+        log(f"Skipping {progress['completed']} already completed components")
     
     if retry_failed:
-        log(f"Retrying {len(checkpoint.failed_components)} previously failed components")
+        log(f"Retrying {progress['failed']} previously failed components")
         # Move failed components back to pending
-        checkpoint.pending_components.extend(checkpoint.failed_components)
-        checkpoint.failed_components.clear()
+        for name in checkpoint.failed_components:
+            checkpoint.mark_pending(name)
         checkpoint.save()
     
     return checkpoint
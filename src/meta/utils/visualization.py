@@ -1,100 +1,102 @@
 """Dependency visualization utilities."""
 
-from typing import Dict, Any, List, Set, Optional
-from meta.utils.manifest import get_components
+import io
+from typing import Dict, Any, List, Set, Optional, Tuple, Mapping
+from meta.utils.manifest import get_components_cached
 from meta.utils.dependencies import resolve_transitive_dependencies
 
 
-def generate_dot_graph(components: Optional[Dict[str, Any]] = None,
-                      manifests_dir: str = "manifests") -> str:
-    """Generate Graphviz DOT format graph."""
-    if components is None:
-        components = get_components(manifests_dir)
+class DependencyGraph:
+    """Component dependency graph, built once and shared between renderers."""
     
-    # Build dependency graph directly from components
-    deps = {}
-    for comp_name in components.keys():
-        deps[comp_name] = components[comp_name].get("depends_on", [])
+    def __init__(self, nodes: Tuple[str, ...], edges: Dict[str, Tuple[str, ...]]):
+        self.nodes = nodes
+        self.edges = edges
+        # Flat (component, dependency) pairs in manifest order
+        self.edge_list: Tuple[Tuple[str, str], ...] = tuple(
+            (comp_name, dep) for comp_name in nodes for dep in edges[comp_name]
+        )
     
-    lines = ["digraph dependencies {"]
-    lines.append("  rankdir=LR;")
-    lines.append("  node [shape=box];")
+    @classmethod
+    def from_components(cls, components: Mapping[str, Any]) -> "DependencyGraph":
+        """Build a graph from a components manifest mapping."""
+        edges = {
+            comp_name: tuple(comp_data.get("depends_on", []))
+            for comp_name, comp_data in components.items()
+        }
+        return cls(tuple(edges), edges)
     
-    # Add nodes
-    for comp_name in components.keys():
-        lines.append(f'  "{comp_name}";')
-    
-    # Add edges
-    for comp_name, comp_data in components.items():
-        depends_on = comp_data.get("depends_on", [])
-        for dep in depends_on:
-            lines.append(f'  "{comp_name}" -> "{dep}";')
+    def __contains__(self, component: str) -> bool:
+        return component in self.edges
+
+
+def _resolve_graph(graph: Optional[DependencyGraph],
+                   components: Optional[Dict[str, Any]],
+                   manifests_dir: str) -> DependencyGraph:
+    if graph is not None:
+        return graph
+    if components is None:
+        components = get_components_cached(manifests_dir)
+    return DependencyGraph.from_components(components)
+
+
+def generate_dot_graph(components: Optional[Dict[str, Any]] = None,
+                      manifests_dir: str = "manifests",
+                      graph: Optional[DependencyGraph] = None) -> str:
+    """Generate Graphviz DOT format graph."""
+    graph = _resolve_graph(graph, components, manifests_dir)
     
-    lines.append("}")
-    return "\n".join(lines)
+    buf = io.StringIO()
+    buf.write("digraph dependencies {\n  rankdir=LR;\n  node [shape=box];")
+    buf.writelines('\n  "%s";' % comp_name for comp_name in graph.nodes)
+    buf.writelines('\n  "%s" -> "%s";' % edge for edge in graph.edge_list)
+    buf.write("\n}")
+    return buf.getvalue()
 
 
 def generate_mermaid_graph(components: Optional[Dict[str, Any]] = None,
-                          manifests_dir: str = "manifests") -> str:
+                          manifests_dir: str = "manifests",
+                          graph: Optional[DependencyGraph] = None) -> str:
     """Generate Mermaid format graph."""
-    if components is None:
-        components = get_components(manifests_dir)
-    
-    # Build dependency graph directly from components
-    deps = {}
-    for comp_name in components.keys():
-        deps[comp_name] = components[comp_name].get("depends_on", [])
-    
-    lines = ["graph TD"]
+    graph = _resolve_graph(graph, components, manifests_dir)
     
-    # Add edges
-    for comp_name, comp_data in components.items():
-        depends_on = comp_data.get("depends_on", [])
-        for dep in depends_on:
-            lines.append(f'    {comp_name} --> {dep}')
-    
-    return "\n".join(lines)
+    buf = io.StringIO()
+    buf.write("graph TD")
+    buf.writelines("\n    %s --> %s" % edge for edge in graph.edge_list)
+    return buf.getvalue()
 
 
 def generate_text_tree(component: str,
                        components: Optional[Dict[str, Any]] = None,
                        manifests_dir: str = "manifests",
-                       max_depth: int = 10) -> str:
+                       max_depth: int = 10,
+                       graph: Optional[DependencyGraph] = None) -> str:
     """Generate text tree representation."""
-    if components is None:
-        components = get_components(manifests_dir)
+    graph = _resolve_graph(graph, components, manifests_dir)
     
-    if component not in components:
+    if component not in graph:
         return f"Component {component} not found"
     
-    # Build dependency map directly from components
-    deps_map = {}
-    for comp_name, comp_data in components.items():
-        deps_map[comp_name] = comp_data.get("depends_on", [])
-    
-    def build_tree(comp: str, depth: int = 0, visited: Set[str] = None) -> List[str]:
-        if visited is None:
-            visited = set()
-        
-        if depth > max_depth or comp in visited:
-            return []
+    # Iterative DFS; `path` holds the ancestors of the node being visited
+    # (added on entry, removed on exit) so cycles are cut without copying.
+    lines: List[str] = []
+    path: Set[str] = set()
+    stack: List[Tuple[str, int, bool]] = [(component, 0, False)]
+    while stack:
+        comp, depth, exiting = stack.pop()
+        if exiting:
+            path.discard(comp)
+            continue
         
-        visited.add(comp)
-        lines = []
+        if depth > max_depth or comp in path:
+            continue
         
+        path.add(comp)
         prefix = "  " * depth + ("└── " if depth > 0 else "")
         lines.append(f"{prefix}{comp}")
         
-        component_deps = sorted(deps_map.get(comp, []))
-        for i, dep in enumerate(component_deps):
-            is_last = i == len(component_deps) - 1
-            sub_prefix = "  " * (depth + 1) + ("└── " if is_last else "├── ")
-            sub_tree = build_tree(dep, depth + 1, visited.copy())
-            if sub_tree:
-                lines.append(sub_tree[0])
-                lines.extend(sub_tree[1:])
-        
-        return lines
+        stack.append((comp, depth, True))
+        for dep in sorted(graph.edges.get(comp, ()), reverse=True):
+            stack.append((dep, depth + 1, False))
     
-    return "\n".join(build_tree(component))
-
+    return "\n".join(lines)
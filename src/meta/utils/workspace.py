@@ -1,43 +1,115 @@
 """Multi-tenant workspace utilities."""
 
+import json
+import os
 import yaml
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from meta.utils.logger import log, error
 from meta.utils.config import get_config
+from meta.utils.json_io import file_signature
+
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
 
 
 WORKSPACE_CONFIG_FILE = ".meta/workspace.yaml"
 
+# Config path -> ((snapshot signature, log signature), workspaces, log records)
+_workspace_cache: Dict[str, Tuple[Tuple[Any, Any], Dict[str, Any], int]] = {}
+
 
 class WorkspaceManager:
     """Manages multiple workspaces."""
     
     def __init__(self, config_file: str = WORKSPACE_CONFIG_FILE):
         self.config_file = Path(config_file)
+        self.log_file = self.config_file.with_suffix(".log.jsonl")
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
+        self._log_records = 0
         self.workspaces: Dict[str, Any] = self._load_workspaces()
         self.current_workspace: Optional[str] = None
     
     def _load_workspaces(self) -> Dict[str, Any]:
-        """Load workspace configuration."""
-        if not self.config_file.exists():
-            return {}
+        """Load workspace configuration.
         
-        try:
-            with open(self.config_file) as f:
-                return yaml.safe_load(f) or {}
-        except Exception as e:
-            error(f"Failed to load workspaces: {e}")
-            return {}
+        Reads the YAML snapshot, then replays changes from the append-only log.
+        The result is cached on both files' (mtime, size), so managers created
+        while nothing has changed skip the parse.
+        """
+        cache_key = os.path.abspath(self.config_file)
+        signature = (file_signature(self.config_file), file_signature(self.log_file))
+        cached = _workspace_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            self._log_records = cached[2]
+            return dict(cached[1])
+        
+        workspaces = self._read_workspaces()
+        _workspace_cache[cache_key] = (signature, dict(workspaces), self._log_records)
+        return workspaces
+    
+    def _read_workspaces(self) -> Dict[str, Any]:
+        """Parse the snapshot and replay the change log (uncached)."""
+        workspaces: Dict[str, Any] = {}
+        if self.config_file.exists():
+            try:
+                with open(self.config_file) as f:
+                    workspaces = yaml.load(f, Loader=_SafeLoader) or {}
+            except Exception as e:
+                error(f"Failed to load workspaces: {e}")
+                return {}
+        
+        if self.log_file.exists():
+            try:
+                with open(self.log_file) as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            # Torn trailing write from an interrupted run
+                            continue
+                        if entry.get("op") == "create":
+                            workspaces[entry["name"]] = entry.get("data", {})
+                        elif entry.get("op") == "delete":
+                            workspaces.pop(entry["name"], None)
+                        self._log_records += 1
+            except Exception as e:
+                error(f"Failed to replay workspace log: {e}")
+        
+        return workspaces
     
     def _save_workspaces(self):
-        """Save workspace configuration."""
+        """Save a full workspace snapshot and truncate the change log."""
         try:
             with open(self.config_file, 'w') as f:
-                yaml.dump(self.workspaces, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(self.workspaces, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+            if self.log_file.exists():
+                self.log_file.unlink()
+            self._log_records = 0
+        except Exception as e:
+            error(f"Failed to save workspaces: {e}")
+    
+    def _append_log(self, op: str, name: str, data: Optional[Dict[str, Any]] = None):
+        """Record a single workspace change in the append-only log."""
+        entry = {"op": op, "name": name}
+        if data is not None:
+            entry["data"] = data
+        try:
+            with open(self.log_file, 'a') as f:
+                f.write(json.dumps(entry) + "\n")
+            self._log_records += 1
         except Exception as e:
             error(f"Failed to save workspaces: {e}")
+            return
+        self._maybe_compact()
+    
+    def _maybe_compact(self):
+        """Fold the change log into the snapshot once it outgrows it."""
+        if self._log_records > 2 * len(self.workspaces):
+            self._save_workspaces()
     
     def create_workspace(self, name: str, manifests_dir: Optional[str] = None) -> bool:
         """Create a new workspace."""
@@ -48,10 +120,10 @@ class WorkspaceManager:
         self.workspaces[name] = {
             "manifests_dir": manifests_dir or f"manifests-{name}",
             "components_dir": f"components-{name}",
-            "created_at": yaml.safe_dump({"timestamp": "now"})  # Simplified
+            "created_at": datetime.utcnow().isoformat() + "Z"
         }
         
-        self._save_workspaces()
+        self._append_log("create", name, self.workspaces[name])
         return True
     
     def switch_workspace(self, name: str) -> bool:
@@ -82,7 +154,7 @@ class WorkspaceManager:
             return False
         
         del self.workspaces[name]
-        self._save_workspaces()
+        self._append_log("delete", name)
         return True
 
 
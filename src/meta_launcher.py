@@ -4,31 +4,36 @@
 import sys
 import os
 import importlib
-import importlib.util
 
 # Get the src directory (this file is in src/)
 _src_dir = os.path.dirname(os.path.abspath(__file__))
-# Ensure src is in path FIRST to override any conflicting meta packages
-if _src_dir not in sys.path:
+# Ensure src is FIRST in path to override any conflicting meta packages
+if not sys.path or sys.path[0] != _src_dir:
+    if _src_dir in sys.path:
+        sys.path.remove(_src_dir)
     sys.path.insert(0, _src_dir)
 
 # Remove any conflicting meta packages from sys.modules
-# This ensures we import our meta package, not a conflicting one
+# This ensures we import our meta package, not a conflicting one.
+# On a fresh interpreter nothing is loaded yet, so this is skipped.
 if 'meta' in sys.modules:
-    # Remove meta and all its submodules
+    # Remove meta and all its submodules (but not e.g. meta_launcher)
     modules_to_remove = [
-        k for k in list(sys.modules.keys()) if k.startswith('meta')
+        k for k in list(sys.modules.keys()) if k == 'meta' or k.startswith('meta.')
     ]
     for mod in modules_to_remove:
         del sys.modules[mod]
 
-# Invalidate import caches to force Python to re-scan
-importlib.invalidate_caches()
+    # Invalidate import caches to force Python to re-scan
+    importlib.invalidate_caches()
 
-# Initialize the meta package properly by importing __init__.py first
-_meta_init_path = os.path.join(_src_dir, 'meta', '__init__.py')
-if os.path.exists(_meta_init_path):
-    # Load meta package
+
+def _load_cli_from_source():
+    """Load meta and meta.cli directly from files next to this launcher."""
+    import importlib.util
+
+    # Initialize the meta package properly by importing __init__.py first
+    _meta_init_path = os.path.join(_src_dir, 'meta', '__init__.py')
     spec = importlib.util.spec_from_file_location('meta', _meta_init_path)
     meta_pkg = importlib.util.module_from_spec(spec)
     sys.modules['meta'] = meta_pkg
@@ -40,10 +45,16 @@ if os.path.exists(_meta_init_path):
     cli_module = importlib.util.module_from_spec(cli_spec)
     sys.modules['meta.cli'] = cli_module
     cli_spec.loader.exec_module(cli_module)
-    main = cli_module.main
-else:
-    # Fallback to normal import
+    return cli_module.main
+
+
+try:
+    # src is sys.path[0], so a normal import resolves to our package
     from meta.cli import main
+except ImportError:
+    if not os.path.exists(os.path.join(_src_dir, 'meta', '__init__.py')):
+        raise
+    main = _load_cli_from_source()
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -1,9 +1,12 @@
 """Pytest configuration and fixtures."""
 
+import itertools
 import pytest
-import tempfile
+import random
+import shutil
+import uuid
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typer.testing import CliRunner
 from .fixtures.di_container import DIContainer
 from .fixtures.mock_factories import (
     mock_git_service,
@@ -15,6 +18,7 @@ from .fixtures.mock_factories import (
     mock_store_service,
     mock_health_service,
     mock_changeset_service,
+    mock_changeset_object,
     mock_vendor_service,
     mock_secret_detection_service,
     mock_vendor_validation_service,
@@ -22,171 +26,177 @@ from .fixtures.mock_factories import (
     mock_vendor_transaction_service,
     mock_vendor_network_service,
     mock_vendor_resume_service,
-    mock_file_system
+    mock_file_system,
+    COMPONENTS_YAML,
+    ENVIRONMENTS_YAML,
+    FEATURES_YAML
 )
 
 
-@pytest.fixture
-def di_container():
-    """Dependency injection container."""
+# Default mock services: DI container name -> factory
+_DEFAULT_SERVICES = {
+    "git": mock_git_service,
+    "bazel": mock_bazel_service,
+    "manifest": mock_manifest_service,
+    "lock": mock_lock_service,
+    "dependencies": mock_dependency_service,
+    "cache": mock_cache_service,
+    "store": mock_store_service,
+    "health": mock_health_service,
+    "changeset": mock_changeset_service,
+    "vendor": mock_vendor_service,
+    "secret_detection": mock_secret_detection_service,
+    "vendor_validation": mock_vendor_validation_service,
+    "vendor_backup": mock_vendor_backup_service,
+    "vendor_transaction": mock_vendor_transaction_service,
+    "vendor_network": mock_vendor_network_service,
+    "vendor_resume": mock_vendor_resume_service,
+}
+
+
+def _build_di_container() -> DIContainer:
+    """Create a container with the default mock services registered."""
     container = DIContainer()
-    # Register default mocks
-    container.register("git", mock_git_service())
-    container.register("bazel", mock_bazel_service())
-    container.register("manifest", mock_manifest_service())
-    container.register("lock", mock_lock_service())
-    container.register("dependencies", mock_dependency_service())
-    container.register("cache", mock_cache_service())
-    container.register("store", mock_store_service())
-    container.register("health", mock_health_service())
-    container.register("changeset", mock_changeset_service())
-    container.register("vendor", mock_vendor_service())
-    container.register("secret_detection", mock_secret_detection_service())
-    container.register("vendor_validation", mock_vendor_validation_service())
-    container.register("vendor_backup", mock_vendor_backup_service())
-    container.register("vendor_transaction", mock_vendor_transaction_service())
-    container.register("vendor_network", mock_vendor_network_service())
-    container.register("vendor_resume", mock_vendor_resume_service())
+    # Register default mocks as factories: each is built on first use, so
+    # tests that never touch a service don't pay for constructing it
+    for name, factory in _DEFAULT_SERVICES.items():
+        container.register_factory(name, factory)
     return container
 
 
-@pytest.fixture
-def temp_meta_repo(di_container):
-    """Create a temporary meta-repo structure."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        repo_path = Path(tmpdir)
-        file_system = mock_file_system(repo_path)
-        
-        yield {
-            "path": repo_path,
-            "manifests": file_system["manifests"],
-            "components": file_system["components"],
-            "di": di_container
-        }
+@pytest.fixture(autouse=True)
+def _deterministic_ids(monkeypatch):
+    """Make uuid4() and the random module repeatable within each test.
+    
+    Changeset, transaction and checkpoint IDs come from uuid4(); seeding per
+    test keeps them independent of test order, so runs under xdist or
+    pytest-randomly generate the same IDs.
+    """
+    counter = itertools.count(1)
+    # Shift into the high bits: callers keep only the first 8 hex digits
+    monkeypatch.setattr(uuid, "uuid4", lambda: uuid.UUID(int=next(counter) << 96))
+    random.seed(0)
 
 
-@pytest.fixture
-def temp_manifests():
-    """Create a temporary manifests directory with basic structure."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        manifests_dir = Path(tmpdir) / "manifests"
-        manifests_dir.mkdir()
-        
-        # Create basic components.yaml
-        components_yaml = manifests_dir / "components.yaml"
-        components_yaml.write_text("""
-components: {}
-""")
-        
-        # Create basic environments.yaml
-        env_yaml = manifests_dir / "environments.yaml"
-        env_yaml.write_text("""
-environments:
-  dev: {}
-""")
-        
-        # Create basic features.yaml
-        features_yaml = manifests_dir / "features.yaml"
-        features_yaml.write_text("""
-features: {}
-""")
-        
-        yield str(manifests_dir)
+@pytest.fixture(scope="session")
+def runner():
+    """CLI test runner; CliRunner keeps no state between invoke() calls."""
+    return CliRunner()
 
 
-@pytest.fixture
-def mock_git(di_container):
-    """Provide a mocked git service."""
-    return di_container.get("git")
+@pytest.fixture(scope="session")
+def _session_di_container():
+    """Container shared by all tests in the session, with its built mocks."""
+    return _build_di_container()
 
 
 @pytest.fixture
-def mock_bazel(di_container):
-    """Provide a mocked bazel service."""
-    return di_container.get("bazel")
+def di_container(request, _session_di_container):
+    """Dependency injection container.
+    
+    The session-wide container is reused: each default mock is built on first
+    use and then kept for the rest of the session. Call records are reset
+    before each test, configured return values are kept, and services or
+    factories registered by the test are rolled back afterwards. Tests that
+    reconfigure the default mocks in place should be marked ``isolated_di``
+    to get a fresh container.
+    """
+    if request.node.get_closest_marker("isolated_di"):
+        yield _build_di_container()
+        return
+    
+    state = _session_di_container.save_state()
+    _session_di_container.reset_mocks()
+    yield _session_di_container
+    _session_di_container.restore_state(state)
 
 
-@pytest.fixture
-def mock_manifest(di_container):
-    """Provide a mocked manifest service."""
-    return di_container.get("manifest")
+@pytest.fixture(scope="session")
+def _manifests_template(tmp_path_factory):
+    """Basic manifests directory, written once and copied into each test."""
+    manifests_dir = tmp_path_factory.mktemp("manifests_template") / "manifests"
+    manifests_dir.mkdir()
+    (manifests_dir / "components.yaml").write_bytes(COMPONENTS_YAML)
+    (manifests_dir / "environments.yaml").write_bytes(ENVIRONMENTS_YAML)
+    (manifests_dir / "features.yaml").write_bytes(FEATURES_YAML)
+    return manifests_dir
 
 
-@pytest.fixture
-def mock_lock(di_container):
-    """Provide a mocked lock service."""
-    return di_container.get("lock")
+@pytest.fixture(scope="session")
+def _meta_repo_template(tmp_path_factory, _manifests_template):
+    """Meta-repo skeleton, built once and shared or copied by each test."""
+    repo_path = tmp_path_factory.mktemp("meta_repo_template") / "meta-repo"
+    repo_path.mkdir()
+    mock_file_system(repo_path, template=_manifests_template)
+    return repo_path
 
 
-@pytest.fixture
-def mock_dependencies(di_container):
-    """Provide a mocked dependency service."""
-    return di_container.get("dependencies")
-
-
-@pytest.fixture
-def mock_cache(di_container):
-    """Provide a mocked cache service."""
-    return di_container.get("cache")
+def _meta_repo_info(repo_path: Path, di_container: DIContainer) -> dict:
+    return {
+        "path": repo_path,
+        "manifests": repo_path / "manifests",
+        "components": repo_path / "components",
+        "di": di_container
+    }
 
 
 @pytest.fixture
-def mock_store(di_container):
-    """Provide a mocked store service."""
-    return di_container.get("store")
+def temp_meta_repo(_meta_repo_template, di_container):
+    """Temporary meta-repo structure shared by all tests; do not write to it.
+    
+    Tests that create or modify files under it use temp_meta_repo_rw.
+    """
+    return _meta_repo_info(_meta_repo_template, di_container)
 
 
 @pytest.fixture
-def mock_health(di_container):
-    """Provide a mocked health service."""
-    return di_container.get("health")
+def temp_meta_repo_rw(tmp_path, di_container, _meta_repo_template):
+    """Create a private, writable copy of the temporary meta-repo structure."""
+    # A subdirectory, so tests can use tmp_path alongside this fixture
+    repo_path = tmp_path / "meta-repo"
+    # Files are copied, not linked: tests rewrite them in place
+    shutil.copytree(_meta_repo_template, repo_path, copy_function=shutil.copyfile)
+    return _meta_repo_info(repo_path, di_container)
 
 
 @pytest.fixture
-def mock_changeset(di_container):
-    """Provide a mocked changeset service."""
-    return di_container.get("changeset")
-
-
-@pytest.fixture
-def mock_vendor(di_container):
-    """Provide a mocked vendor service."""
-    return di_container.get("vendor")
-
-
-@pytest.fixture
-def mock_secret_detection(di_container):
-    """Provide a mocked secret detection service."""
-    return di_container.get("secret_detection")
-
-
-@pytest.fixture
-def mock_vendor_validation(di_container):
-    """Provide a mocked vendor validation service."""
-    return di_container.get("vendor_validation")
+def temp_manifests(tmp_path, _manifests_template):
+    """Create a temporary manifests directory with basic structure."""
+    manifests_dir = tmp_path / "manifests-fixture" / "manifests"
+    # Files are copied, not linked: tests rewrite them in place
+    shutil.copytree(_manifests_template, manifests_dir, copy_function=shutil.copyfile)
+    return str(manifests_dir)
 
 
 @pytest.fixture
-def mock_vendor_backup(di_container):
-    """Provide a mocked vendor backup service."""
-    return di_container.get("vendor_backup")
+def patch_meta(monkeypatch):
+    """Provide a helper that patches dotted targets until the test ends.
+    
+    patch_meta({"meta.commands.apply.get_components": MagicMock(...)}) sets
+    every target through monkeypatch and returns the mapping, so tests can
+    make assertions on the replacements.
+    """
+    def _patch(targets: dict) -> dict:
+        for target, value in targets.items():
+            monkeypatch.setattr(target, value)
+        return targets
+    return _patch
 
 
-@pytest.fixture
-def mock_vendor_transaction(di_container):
-    """Provide a mocked vendor transaction service."""
-    return di_container.get("vendor_transaction")
+def _service_fixture(name: str):
+    """Create a fixture that provides the named service from di_container."""
+    def _fixture(di_container):
+        return di_container.get(name)
+    _fixture.__doc__ = f"Provide a mocked {name.replace('_', ' ')} service."
+    return pytest.fixture(name=f"mock_{name}")(_fixture)
 
 
-@pytest.fixture
-def mock_vendor_network(di_container):
-    """Provide a mocked vendor network service."""
-    return di_container.get("vendor_network")
+# mock_git, mock_bazel, ... mock_vendor_resume
+for _name in _DEFAULT_SERVICES:
+    globals()[f"mock_{_name}"] = _service_fixture(_name)
 
 
 @pytest.fixture
-def mock_vendor_resume(di_container):
-    """Provide a mocked vendor resume service."""
-    return di_container.get("vendor_resume")
-
-
+def make_changeset_mock():
+    """Provide a factory for mock Changeset objects, e.g. make_changeset_mock(id="cs-1")."""
+    return mock_changeset_object
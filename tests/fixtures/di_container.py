@@ -1,14 +1,24 @@
 """Dependency injection container for testing."""
-from typing import Dict, Any, Callable, Optional
-from unittest.mock import MagicMock
+from typing import Dict, Any, Callable, Set, Tuple
+from unittest.mock import MagicMock, NonCallableMock
+
+
+_MISSING = object()
 
 
 class DIContainer:
     """Dependency injection container for tests."""
     
+    __slots__ = ("_services", "_factories", "_built", "_accessed")
+    
     def __init__(self):
         self._services: Dict[str, Any] = {}
         self._factories: Dict[str, Callable] = {}
+        # Services built by get(), with the factory that built them; these
+        # are not registrations, so restore_state() keeps them
+        self._built: Dict[str, Tuple[Callable, Any]] = {}
+        # Names handed out by get() since the last reset_mocks()
+        self._accessed: Set[str] = set()
     
     def register(self, name: str, service: Any):
         """Register a service instance."""
@@ -20,13 +30,18 @@ class DIContainer:
     
     def get(self, name: str) -> Any:
         """Get a service, creating if factory exists."""
-        if name in self._services:
-            return self._services[name]
-        if name in self._factories:
-            service = self._factories[name]()
-            self._services[name] = service
+        service = self._services.get(name, _MISSING)
+        if service is not _MISSING:
             return service
-        raise KeyError(f"Service '{name}' not found")
+        factory = self._factories.get(name)
+        if factory is None:
+            raise KeyError(f"Service '{name}' not found")
+        built = self._built.get(name)
+        if built is None or built[0] is not factory:
+            built = (factory, factory())
+            self._built[name] = built
+        self._accessed.add(name)
+        return built[1]
     
     def mock(self, name: str) -> MagicMock:
         """Create and register a mock service."""
@@ -34,9 +49,36 @@ class DIContainer:
         self.register(name, mock)
         return mock
     
+    def save_state(self) -> Tuple[Dict[str, Any], Dict[str, Callable]]:
+        """Capture the current registrations."""
+        return dict(self._services), dict(self._factories)
+    
+    def restore_state(self, state: Tuple[Dict[str, Any], Dict[str, Callable]]):
+        """Restore registrations captured by save_state.
+        
+        Services already built from a restored factory are kept, so they are
+        not rebuilt on the next get().
+        """
+        self._services = dict(state[0])
+        self._factories = dict(state[1])
+    
+    def reset_mocks(self):
+        """Reset call records on mock services, keeping their configuration.
+        
+        Only services handed out by get() since the last reset can have been
+        called, so the others are skipped.
+        """
+        for name in self._accessed:
+            built = self._built.get(name)
+            if built is not None and isinstance(built[1], NonCallableMock):
+                built[1].reset_mock()
+        self._accessed.clear()
+    
     def clear(self):
         """Clear all registered services."""
         self._services.clear()
         self._factories.clear()
+        self._built.clear()
+        self._accessed.clear()
 
 
@@ -1,27 +1,52 @@
 """Integration tests for dependency validation."""
 
 import pytest
-import tempfile
+import typer
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 from typer.testing import CliRunner
 from meta.cli import app
+from meta.commands.validate import validate
+
+
+# Click builds a fresh context per invoke, so one runner serves every test
+RUNNER = CliRunner()
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _stub_git_bazel():
+    """Report Git and Bazel as available for every test in this module."""
+    with patch('meta.utils.git.git_available', return_value=True), \
+         patch('meta.utils.bazel.bazel_available', return_value=True):
+        yield
+
+
+def _run_validate(manifests_dir: Path) -> int:
+    """Call the validate callback directly, returning its exit code."""
+    try:
+        validate(
+            MagicMock(invoked_subcommand=None),
+            env="dev",
+            manifests_dir=str(manifests_dir),
+            skip_bazel=True,
+            skip_git=True
+        )
+    except typer.Exit as e:
+        return e.exit_code
+    return 0
 
 
 class TestDependencyValidation:
     """Integration tests for dependency validation in validate command."""
     
-    def test_validate_detects_missing_dependencies(self):
+    def test_validate_detects_missing_dependencies(self, temp_manifests):
         """Test that validate command detects missing dependencies."""
-        runner = CliRunner()
+        # Shared environments.yaml/features.yaml come from the session template
+        manifests_dir = Path(temp_manifests)
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manifests_dir = Path(tmpdir) / "manifests"
-            manifests_dir.mkdir()
-            
-            # Create components.yaml with missing dependency
-            components_yaml = manifests_dir / "components.yaml"
-            components_yaml.write_text("""
+        # Create components.yaml with missing dependency
+        components_yaml = manifests_dir / "components.yaml"
+        components_yaml.write_text("""
 components:
   component-a:
     repo: "git@github.com:test/a.git"
@@ -30,41 +55,23 @@ components:
     depends_on:
       - component-b  # Missing
 """)
-            
-            # Create environments.yaml
-            env_yaml = manifests_dir / "environments.yaml"
-            env_yaml.write_text("""
-environments:
-  dev: {}
-""")
-            
-            # Create features.yaml
-            features_yaml = manifests_dir / "features.yaml"
-            features_yaml.write_text("""
-features: {}
-""")
-            
-            with patch('meta.utils.git.git_available', return_value=True), \
-                 patch('meta.utils.bazel.bazel_available', return_value=True):
-                result = runner.invoke(
-                    app,
-                    ["validate", "--manifests", str(manifests_dir), "--skip-bazel", "--skip-git"]
-                )
-                
-                # Should fail due to missing dependency
-                assert result.exit_code == 1
+        
+        result = RUNNER.invoke(
+            app,
+            ["validate", "--manifests", str(manifests_dir), "--skip-bazel", "--skip-git"]
+        )
+        
+        # Should fail due to missing dependency
+        assert result.exit_code == 1
     
-    def test_validate_detects_circular_dependencies(self):
+    def test_validate_detects_circular_dependencies(self, temp_manifests):
         """Test that validate command detects circular dependencies."""
-        runner = CliRunner()
+        # Shared environments.yaml/features.yaml come from the session template
+        manifests_dir = Path(temp_manifests)
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manifests_dir = Path(tmpdir) / "manifests"
-            manifests_dir.mkdir()
-            
-            # Create components.yaml with circular dependency
-            components_yaml = manifests_dir / "components.yaml"
-            components_yaml.write_text("""
+        # Create components.yaml with circular dependency
+        components_yaml = manifests_dir / "components.yaml"
+        components_yaml.write_text("""
 components:
   component-a:
     repo: "git@github.com:test/a.git"
@@ -79,28 +86,9 @@ components:
     depends_on:
       - component-a  # Cycle
 """)
-            
-            # Create environments.yaml
-            env_yaml = manifests_dir / "environments.yaml"
-            env_yaml.write_text("""
-environments:
-  dev: {}
-""")
-            
-            # Create features.yaml
-            features_yaml = manifests_dir / "features.yaml"
-            features_yaml.write_text("""
-features: {}
-""")
-            
-            with patch('meta.utils.git.git_available', return_value=True), \
-                 patch('meta.utils.bazel.bazel_available', return_value=True):
-                result = runner.invoke(
-                    app,
-                    ["validate", "--manifests", str(manifests_dir), "--skip-bazel", "--skip-git"]
-                )
-                
-                # Should fail due to circular dependency
-                assert result.exit_code == 1
+        
+        # Should fail due to circular dependency; the CLI wiring is covered
+        # by test_validate_detects_missing_dependencies
+        assert _run_validate(manifests_dir) == 1
 
 
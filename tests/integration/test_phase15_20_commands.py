@@ -1,59 +1,44 @@
 """Integration tests for Phase 15-20 commands."""
 
+import functools
+import importlib
 import pytest
-import tempfile
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+
+
+@functools.lru_cache(maxsize=None)
+def _command_available(name: str) -> bool:
+    """Import meta.commands.<name> once per session, remembering failures too."""
+    try:
+        importlib.import_module(f"meta.commands.{name}")
+    except ImportError:
+        return False
+    return True
+
+
+def _require_command(name: str):
+    """Skip the calling test if the command module cannot be imported."""
+    if not _command_available(name):
+        pytest.skip(f"{name.capitalize()} command not available")
 
 
 class TestPhase15Commands:
     """Integration tests for Phase 15 commands."""
     
-    def test_templates_command(self):
-        """Test templates command."""
-        # This would test the actual CLI command execution
-        # For now, just verify the command module exists
-        try:
-            from meta.commands import templates
-            assert templates is not None
-        except ImportError:
-            pytest.skip("Templates command not available")
-    
-    def test_alias_command(self):
-        """Test alias command."""
-        try:
-            from meta.commands import alias
-            assert alias is not None
-        except ImportError:
-            pytest.skip("Alias command not available")
-    
-    def test_search_command(self):
-        """Test search command."""
-        try:
-            from meta.commands import search
-            assert search is not None
-        except ImportError:
-            pytest.skip("Search command not available")
+    # This would test the actual CLI command execution
+    # For now, just verify the command modules exist
+    @pytest.mark.parametrize("name", ["templates", "alias", "search"])
+    def test_command_importable(self, name):
+        """Test Phase 15 command modules import."""
+        _require_command(name)
 
 
 class TestPhase16Commands:
     """Integration tests for Phase 16 commands."""
     
-    def test_deploy_command(self):
-        """Test deploy command."""
-        try:
-            from meta.commands import deploy
-            assert deploy is not None
-        except ImportError:
-            pytest.skip("Deploy command not available")
-    
-    def test_sync_command(self):
-        """Test sync command."""
-        try:
-            from meta.commands import sync
-            assert sync is not None
-        except ImportError:
-            pytest.skip("Sync command not available")
+    @pytest.mark.parametrize("name", ["deploy", "sync"])
+    def test_command_importable(self, name):
+        """Test Phase 16 command modules import."""
+        _require_command(name)
 
 
 class TestPhase20Commands:
@@ -61,10 +46,4 @@ class TestPhase20Commands:
     
     def test_os_command(self):
         """Test OS command."""
-        try:
-            from meta.commands import os as os_cmd
-            assert os_cmd is not None
-        except ImportError:
-            pytest.skip("OS command not available")
-
-
+        _require_command("os")
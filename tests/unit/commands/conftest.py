@@ -0,0 +1,39 @@
+"""Fixtures shared by the command tests."""
+
+import pytest
+from unittest.mock import MagicMock
+
+
+@pytest.fixture(autouse=True)
+def no_subprocess(monkeypatch):
+    """Replace subprocess.run so command tests never spawn real processes.
+
+    The mock returns a successful result with empty output by default; tests
+    that need something else request this fixture and configure it.
+    """
+    result = MagicMock(returncode=0, stdout="", stderr="")
+    mock_run = MagicMock(return_value=result)
+    monkeypatch.setattr("subprocess.run", mock_run)
+    return mock_run
+
+
+# Every name the commands look the tool checks up by: where the helper is
+# defined, plus each command module that imports it directly
+_TOOL_CHECKS = (
+    "meta.utils.git.git_available",
+    "meta.commands.git.git_available",
+    "meta.commands.validate.git_available",
+    "meta.utils.bazel.bazel_available",
+    "meta.commands.validate.bazel_available",
+)
+
+
+@pytest.fixture(autouse=True)
+def tools_available(monkeypatch):
+    """Report git and Bazel as installed, whatever the host has.
+
+    Tests that need a tool to be missing patch the name the command under
+    test calls, e.g. ``meta.commands.git.git_available``.
+    """
+    for target in _TOOL_CHECKS:
+        monkeypatch.setattr(target, lambda: True)
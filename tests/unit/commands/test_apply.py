@@ -1,7 +1,6 @@
 """Tests for meta apply command with dependency injection."""
 import pytest
 from unittest.mock import patch, MagicMock
-from typer.testing import CliRunner
 from meta.cli import app
 from pathlib import Path
 
@@ -10,110 +9,70 @@ class TestApplyCommand:
     """Tests for apply command with mocks."""
     
     @pytest.fixture
-    def runner(self):
-        """CLI test runner."""
-        return CliRunner()
-    
-    def test_apply_with_mocks(self, runner, temp_meta_repo, mock_git, mock_bazel, mock_manifest):
-        """Test apply command with all dependencies mocked."""
-        with patch('meta.commands.apply.get_components') as mock_get_components, \
-             patch('meta.utils.git.checkout_version') as mock_checkout, \
-             patch('meta.utils.bazel.run_bazel_build') as mock_build, \
-             patch('meta.utils.git.clone_repo') as mock_clone, \
-             patch('meta.utils.lock.get_locked_components') as mock_locked, \
-             patch('meta.utils.git.git_available', return_value=True), \
-             patch('meta.utils.bazel.bazel_available', return_value=True), \
-             patch('pathlib.Path.exists', return_value=True):
-            
-            mock_get_components.return_value = {
+    def base_apply_mocks(self, patch_meta):
+        """Patch the components manifest shared by every apply variant."""
+        return patch_meta({
+            'meta.commands.apply.get_components': MagicMock(return_value={
                 "test-component": {
                     "repo": "git@github.com:test/test.git",
                     "version": "v1.0.0",
                     "type": "bazel",
                     "build_target": "//test:all"
                 }
-            }
-            mock_locked.return_value = {}
-            mock_clone.return_value = True
-            mock_checkout.return_value = True
-            mock_build.return_value = True
-            
-            result = runner.invoke(app, ["apply", "--env", "dev"])
-            
-            # Apply may exit with 0 or 1 depending on implementation
-            assert result.exit_code in [0, 1]
+            })
+        })
     
-    def test_apply_with_lock_file(self, runner, temp_meta_repo, mock_git, mock_lock):
-        """Test apply command with lock file."""
-        with patch('meta.commands.apply.get_components') as mock_get_components, \
-             patch('meta.utils.lock.get_locked_components') as mock_locked, \
-             patch('meta.utils.git.checkout_version') as mock_checkout, \
-             patch('meta.utils.git.git_available', return_value=True), \
-             patch('meta.utils.bazel.bazel_available', return_value=True), \
-             patch('pathlib.Path.exists', return_value=True):
-            
-            mock_get_components.return_value = {
-                "test-component": {
-                    "repo": "git@github.com:test/test.git",
-                    "version": "v1.0.0",
-                    "type": "bazel"
-                }
-            }
-            mock_locked.return_value = {
+    # extra_returns maps each further patch target to its mock's return value;
+    # existing lists the paths, relative to the meta-repo, that must be on disk
+    @pytest.mark.parametrize("extra_args,extra_returns,existing,called,exit_codes", [
+        ([], {
+            'meta.utils.git.checkout_version': True,
+            'meta.utils.bazel.run_bazel_build': True,
+            'meta.utils.git.clone_repo': True,
+            'meta.utils.lock.get_locked_components': {}
+        }, ["components/test-component/"], None, [0, 1]),
+        (["--locked"], {
+            'meta.utils.lock.get_locked_components': {
                 "test-component": {
                     "commit": "abc123def456",
                     "version": "v1.0.0"
                 }
-            }
-            mock_checkout.return_value = True
-            
-            result = runner.invoke(app, ["apply", "--env", "dev", "--locked"])
-            
-            # Apply may exit with 0 or 1 depending on implementation
-            assert result.exit_code in [0, 1]
-    
-    def test_apply_specific_component(self, runner, temp_meta_repo, mock_git, mock_bazel):
-        """Test apply command for specific component."""
-        with patch('meta.commands.apply.get_components') as mock_get_components, \
-             patch('meta.commands.apply.apply_component') as mock_apply_comp:
-            
-            mock_get_components.return_value = {
-                "test-component": {
-                    "repo": "git@github.com:test/test.git",
-                    "version": "v1.0.0",
-                    "type": "bazel"
-                }
-            }
-            mock_apply_comp.return_value = True
-            
-            result = runner.invoke(app, ["apply", "--env", "dev", "--component", "test-component"])
-            
-            assert result.exit_code == 0
-            mock_apply_comp.assert_called_once()
-    
-    def test_apply_with_isolate(self, runner, temp_meta_repo, mock_git):
-        """Test apply command with isolation."""
-        with patch('meta.commands.apply.get_components') as mock_get_components, \
-             patch('meta.commands.apply.apply_component') as mock_apply_comp, \
-             patch('meta.utils.isolation.setup_venv') as mock_venv, \
-             patch('meta.utils.git.git_available', return_value=True):
-            
-            mock_get_components.return_value = {
-                "test-component": {
-                    "repo": "git@github.com:test/test.git",
-                    "version": "v1.0.0",
-                    "type": "bazel"
-                }
-            }
-            mock_apply_comp.return_value = True
-            mock_venv.return_value = Path("/tmp/venv")
-            
-            result = runner.invoke(app, ["apply", "--env", "dev", "--isolate"])
-            
-            # Apply may exit with 0 or 1 depending on implementation
-            assert result.exit_code in [0, 1]
+            },
+            'meta.utils.git.checkout_version': True
+        }, ["components/test-component/", "manifests/components.lock.yaml"], None, [0, 1]),
+        (["--component", "test-component"], {
+            'meta.commands.apply.apply_component': True
+        }, [], 'meta.commands.apply.apply_component', [0]),
+        (["--isolate"], {
+            'meta.commands.apply.apply_component': True,
+            'meta.utils.isolation.setup_venv': Path("/tmp/venv")
+        }, [], None, [0, 1]),
+    ], ids=["with-mocks", "with-lock-file", "specific-component", "with-isolate"])
+    def test_apply_variant(self, runner, temp_meta_repo_rw, mock_git, mock_bazel, base_apply_mocks,
+                           patch_meta, monkeypatch, extra_args, extra_returns, existing, called,
+                           exit_codes):
+        """Test apply command flag variants with dependencies mocked."""
+        mocks = patch_meta({
+            target: MagicMock(return_value=value) for target, value in extra_returns.items()
+        })
+        # apply resolves components/ and manifests/ against the working directory
+        repo_path = temp_meta_repo_rw["path"]
+        for rel_path in existing:
+            path = repo_path / rel_path
+            if rel_path.endswith("/"):
+                path.mkdir(parents=True)
+            else:
+                path.touch()
+        monkeypatch.chdir(repo_path)
+        
+        result = runner.invoke(app, ["apply", "--env", "dev", *extra_args])
+        
+        # Apply may exit with 0 or 1 depending on implementation
+        assert result.exit_code in exit_codes
+        if called:
+            mocks[called].assert_called_once()
     
-    def test_apply_component_function(self, temp_meta_repo, mock_git, mock_bazel):
+    def test_apply_component_function(self, temp_meta_repo_rw, mock_git, mock_bazel, monkeypatch):
         """Test apply_component function directly."""
         from meta.commands.apply import apply_component
         from pathlib import Path
@@ -125,25 +84,25 @@ class TestApplyCommand:
             "build_target": "//test:all"
         }
         
-        # Create component directory
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        # Create component directory; apply looks for it under the working directory
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir(exist_ok=True)
+        monkeypatch.chdir(temp_meta_repo_rw["path"])
         
-        with patch('meta.commands.apply.clone_repo', return_value=True), \
-             patch('meta.commands.apply.checkout_version', return_value=True), \
-             patch('meta.commands.apply.pull_latest', return_value=True), \
-             patch('meta.utils.bazel.run_bazel_build', return_value=True), \
-             patch('meta.utils.bazel.run_bazel_test', return_value=True), \
-             patch('meta.commands.apply.install_component_dependencies', return_value=True), \
-             patch('meta.utils.git.git_available', return_value=True), \
-             patch('meta.utils.bazel.bazel_available', return_value=True), \
-             patch('pathlib.Path.exists', new=lambda self: True if ("test-component" in str(self) and ".git" not in str(self) and "components" in str(self)) else (False if ".git" in str(self) else Path(str(self)).exists())):
+        with patch.multiple('meta.commands.apply',
+                            clone_repo=MagicMock(return_value=True),
+                            checkout_version=MagicMock(return_value=True),
+                            pull_latest=MagicMock(return_value=True),
+                            install_component_dependencies=MagicMock(return_value=True)), \
+             patch.multiple('meta.utils.bazel',
+                            run_bazel_build=MagicMock(return_value=True),
+                            run_bazel_test=MagicMock(return_value=True)):
             
             result = apply_component(
                 "test-component",
                 comp,
                 "dev",
-                str(temp_meta_repo["manifests"].parent)
+                str(temp_meta_repo_rw["manifests"].parent)
             )
             
             assert result is True
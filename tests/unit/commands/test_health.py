@@ -1,18 +1,12 @@
 """Tests for meta health command with dependency injection."""
 import pytest
-from unittest.mock import patch, MagicMock
-from typer.testing import CliRunner
+from unittest.mock import patch
 from meta.cli import app
 
 
 class TestHealthCommand:
     """Tests for health command with mocks."""
     
-    @pytest.fixture
-    def runner(self):
-        """CLI test runner."""
-        return CliRunner()
-    
     def test_health_check(self, runner, temp_meta_repo, mock_health):
         """Test health check command."""
         from meta.utils.health import HealthStatus
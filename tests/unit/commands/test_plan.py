@@ -1,122 +1,82 @@
 """Tests for meta plan command with dependency injection."""
 import pytest
-from unittest.mock import patch, MagicMock
-from typer.testing import CliRunner
+from unittest.mock import MagicMock
 from meta.cli import app
 
 
+# Shared get_components() return values; the code under test only reads them
+COMPONENTS = {
+    "test-component": {
+        "version": "v1.0.0",
+        "type": "bazel"
+    }
+}
+UPGRADED_COMPONENTS = {
+    "test-component": {
+        **COMPONENTS["test-component"],
+        "version": "v2.0.0"
+    }
+}
+
+
+@pytest.fixture
+def plan_patches(patch_meta):
+    """Replace the helpers plan looks up; no component is checked out yet.
+    
+    Keys are the helper names; tests adjust return values on the returned
+    mocks before running the plan.
+    """
+    mocks = {
+        "get_components": MagicMock(return_value=COMPONENTS),
+        "get_environment_config": MagicMock(return_value={}),
+        "get_current_version": MagicMock(return_value=None),
+        "compare_versions": MagicMock(return_value=0),
+    }
+    patch_meta({f"meta.commands.plan.{name}": mock for name, mock in mocks.items()})
+    return mocks
+
+
 class TestPlanCommand:
     """Tests for plan command with mocks."""
     
-    @pytest.fixture
-    def runner(self):
-        """CLI test runner."""
-        return CliRunner()
-    
-    def test_plan_with_mocks(self, runner, temp_meta_repo, mock_git, mock_manifest):
-        """Test plan command with all dependencies mocked."""
-        with patch('meta.commands.plan.get_components') as mock_get_components, \
-             patch('meta.commands.plan.get_environment_config') as mock_get_env, \
-             patch('meta.commands.plan.get_current_version') as mock_get_current:
-            
-            mock_get_components.return_value = {
-                "test-component": {
-                    "version": "v1.0.0",
-                    "type": "bazel"
-                }
-            }
-            mock_get_env.return_value = {}
-            mock_get_current.return_value = None  # Component not checked out
-            
-            result = runner.invoke(app, ["plan", "--env", "dev"])
-            
-            assert result.exit_code == 0
+    @pytest.mark.parametrize("current, components, comparison, heading", [
+        (None, COMPONENTS, 0, "New Components"),
+        ("v1.0.0", UPGRADED_COMPONENTS, -1, "Version Upgrades"),
+        ("v2.0.0", COMPONENTS, 1, "Version Downgrades"),
+    ], ids=["new", "upgrade", "downgrade"])
+    def test_plan_version_states(self, runner, temp_meta_repo, mock_git, plan_patches,
+                                 current, components, comparison, heading):
+        """Test plan command for a new, upgraded and downgraded component."""
+        plan_patches["get_components"].return_value = components
+        plan_patches["get_current_version"].return_value = current
+        # Sign of current vs desired: -1 upgrade, 1 downgrade
+        plan_patches["compare_versions"].return_value = comparison
+        
+        result = runner.invoke(app, ["plan", "--env", "dev"])
+        
+        assert result.exit_code == 0
+        assert heading in result.output
     
-    def test_compute_changes_function(self, temp_meta_repo, mock_git):
+    def test_compute_changes_function(self, temp_meta_repo, mock_git, plan_patches):
         """Test compute_changes function directly."""
         from meta.commands.plan import compute_changes
         
-        with patch('meta.commands.plan.get_components') as mock_get_components, \
-             patch('meta.commands.plan.get_environment_config') as mock_get_env, \
-             patch('meta.commands.plan.get_current_version') as mock_get_current, \
-             patch('meta.commands.plan.compare_versions') as mock_compare:
-            
-            mock_get_components.return_value = {
-                "test-component": {
-                    "version": "v1.0.0",
-                    "type": "bazel"
-                }
-            }
-            mock_get_env.return_value = {}
-            mock_get_current.return_value = None
-            mock_compare.return_value = 0
-            
-            changes = compute_changes("dev", str(temp_meta_repo["manifests"]))
-            
-            assert "new" in changes
-            assert "upgrades" in changes
-            assert "downgrades" in changes
-            assert "unchanged" in changes
-    
-    def test_plan_with_upgrades(self, runner, temp_meta_repo, mock_git):
-        """Test plan command showing upgrades."""
-        with patch('meta.commands.plan.get_components') as mock_get_components, \
-             patch('meta.commands.plan.get_environment_config') as mock_get_env, \
-             patch('meta.commands.plan.get_current_version') as mock_get_current, \
-             patch('meta.commands.plan.compare_versions') as mock_compare:
-            
-            mock_get_components.return_value = {
-                "test-component": {
-                    "version": "v2.0.0",
-                    "type": "bazel"
-                }
-            }
-            mock_get_env.return_value = {}
-            mock_get_current.return_value = "v1.0.0"
-            mock_compare.return_value = -1  # Current < desired (upgrade)
-            
-            result = runner.invoke(app, ["plan", "--env", "dev"])
-            
-            assert result.exit_code == 0
-    
-    def test_plan_with_downgrades(self, runner, temp_meta_repo, mock_git):
-        """Test plan command showing downgrades."""
-        with patch('meta.commands.plan.get_components') as mock_get_components, \
-             patch('meta.commands.plan.get_environment_config') as mock_get_env, \
-             patch('meta.commands.plan.get_current_version') as mock_get_current, \
-             patch('meta.commands.plan.compare_versions') as mock_compare:
-            
-            mock_get_components.return_value = {
-                "test-component": {
-                    "version": "v1.0.0",
-                    "type": "bazel"
-                }
-            }
-            mock_get_env.return_value = {}
-            mock_get_current.return_value = "v2.0.0"
-            mock_compare.return_value = 1  # Current > desired (downgrade)
-            
-            result = runner.invoke(app, ["plan", "--env", "dev"])
-            
-            assert result.exit_code == 0
+        changes = compute_changes("dev", str(temp_meta_repo["manifests"]))
+        
+        assert "new" in changes
+        assert "upgrades" in changes
+        assert "downgrades" in changes
+        assert "unchanged" in changes
     
-    def test_plan_specific_component(self, runner, temp_meta_repo, mock_git):
-        """Test plan command for specific component."""
-        with patch('meta.commands.plan.get_components') as mock_get_components, \
-             patch('meta.commands.plan.get_environment_config') as mock_get_env, \
-             patch('meta.commands.plan.get_current_version') as mock_get_current:
-            
-            mock_get_components.return_value = {
-                "test-component": {
-                    "version": "v1.0.0",
-                    "type": "bazel"
-                }
-            }
-            mock_get_env.return_value = {}
-            mock_get_current.return_value = None
-            
-            result = runner.invoke(app, ["plan", "--env", "dev", "--component", "test-component"])
-            
-            assert result.exit_code == 0
-
-
+    @pytest.mark.parametrize("component, expected", [
+        ("test-component", "New Components"),
+        ("other-component", "No changes planned for component: other-component"),
+    ], ids=["listed", "unlisted"])
+    def test_plan_specific_component(self, temp_meta_repo, mock_git, plan_patches, capsys,
+                                     component, expected):
+        """Test plan function filtered to one component, without the CLI layer."""
+        from meta.commands.plan import plan
+        
+        plan(MagicMock(invoked_subcommand=None), env="dev", manifests_dir="manifests", component=component)
+        
+        assert expected in capsys.readouterr().out
@@ -2,105 +2,97 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
-from pathlib import Path
-from typer.testing import CliRunner
 from meta.cli import app
 
 
+# Shared get_components() return value; the code under test only reads it
+COMPONENTS = {
+    "test-component": {
+        "repo": "git@github.com:test/test.git",
+        "version": "v1.0.0"
+    }
+}
+
+
+@pytest.fixture
+def vendor_patches(patch_meta):
+    """Put the command in vendored mode with COMPONENTS, vendoring succeeding.
+    
+    Keys are the helper names in meta.commands.vendor; tests adjust the
+    returned mocks or patch further helpers with patch_meta.
+    """
+    mocks = {
+        "is_vendored_mode": MagicMock(return_value=True),
+        "get_components": MagicMock(return_value=COMPONENTS),
+        "vendor_component": MagicMock(return_value=True),
+    }
+    patch_meta({f"meta.commands.vendor.{name}": mock for name, mock in mocks.items()})
+    return mocks
+
+
 class TestVendorCommand:
     """Test vendor command group."""
     
-    def test_vendor_import_component(self, temp_meta_repo, mock_vendor):
+    def test_vendor_import_component(self, runner, temp_meta_repo, mock_vendor, vendor_patches):
         """Test importing a single component."""
-        runner = CliRunner()
-        
-        with patch("meta.commands.vendor.is_vendored_mode", return_value=True), \
-             patch("meta.commands.vendor.get_components", return_value={
-                 "test-component": {
-                     "repo": "git@github.com:test/test.git",
-                     "version": "v1.0.0"
-                 }
-             }), \
-             patch("meta.commands.vendor.vendor_component", return_value=True):
-            
-            result = runner.invoke(app, [
-                "vendor", "import-component", "test-component"
-            ])
-            
-            assert result.exit_code == 0
-    
-    def test_vendor_import_all(self, temp_meta_repo, mock_vendor):
-        """Test importing all components."""
-        runner = CliRunner()
-        
-        with patch("meta.commands.vendor.is_vendored_mode", return_value=True), \
-             patch("meta.commands.vendor.get_components", return_value={
-                 "test-component": {
-                     "repo": "git@github.com:test/test.git",
-                     "version": "v1.0.0"
-                 }
-             }), \
-             patch("meta.commands.vendor.vendor_component", return_value=True):
-            
-            result = runner.invoke(app, ["vendor", "import-all"])
-            
-            assert result.exit_code == 0
-    
-    def test_vendor_status(self, temp_meta_repo, mock_vendor):
-        """Test vendor status command."""
-        runner = CliRunner()
-        
-        with patch("meta.commands.vendor.is_vendored_mode", return_value=True), \
-             patch("meta.commands.vendor.get_components", return_value={
-                 "test-component": {
-                     "repo": "git@github.com:test/test.git",
-                     "version": "v1.0.0"
-                 }
-             }), \
-             patch("meta.commands.vendor.find_meta_repo_root", return_value=temp_meta_repo["path"]), \
-             patch("meta.commands.vendor.get_vendor_info", return_value={
-                 "version": "v1.0.0",
-                 "vendored_at": "2024-01-15T10:30:00Z"
-             }), \
-             patch("pathlib.Path.exists", return_value=True):
-            
-            result = runner.invoke(app, ["vendor", "status"])
-            
-            assert result.exit_code == 0
-    
-    def test_vendor_convert_to_vendored(self, temp_meta_repo, mock_vendor):
-        """Test converting to vendored mode."""
-        runner = CliRunner()
-        
-        with patch("meta.commands.vendor.convert_to_vendored_mode_enhanced", return_value=(True, {'successful': ['comp1']})):
-            result = runner.invoke(app, ["vendor", "convert", "vendored"])
-            
-            assert result.exit_code == 0
-    
-    def test_vendor_convert_to_reference(self, temp_meta_repo, mock_vendor):
-        """Test converting to reference mode."""
-        runner = CliRunner()
+        result = runner.invoke(app, [
+            "vendor", "import-component", "test-component"
+        ])
         
-        with patch("meta.commands.vendor.convert_to_reference_mode", return_value=True):
-            result = runner.invoke(app, ["vendor", "convert", "reference"])
-            
-            assert result.exit_code == 0
+        assert result.exit_code == 0
+        assert vendor_patches["vendor_component"].call_args[0][0] == "test-component"
     
-    def test_vendor_convert_invalid_mode(self, temp_meta_repo, mock_vendor):
-        """Test converting with invalid mode."""
-        runner = CliRunner()
-        
-        result = runner.invoke(app, ["vendor", "convert", "invalid"])
+    def test_vendor_import_all(self, runner, temp_meta_repo, mock_vendor, vendor_patches):
+        """Test importing all components."""
+        result = runner.invoke(app, ["vendor", "import-all"])
         
-        assert result.exit_code == 1
+        assert result.exit_code == 0
+        assert vendor_patches["vendor_component"].call_count == len(COMPONENTS)
     
-    def test_vendor_release(self, temp_meta_repo, mock_vendor):
+    def test_vendor_status(self, runner, temp_meta_repo_rw, mock_vendor, vendor_patches, patch_meta):
+        """Test vendor status command."""
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
+        comp_dir.mkdir()
+        mocks = patch_meta({
+            "meta.commands.vendor.find_meta_repo_root": MagicMock(return_value=temp_meta_repo_rw["path"]),
+            "meta.commands.vendor.get_vendor_info": MagicMock(return_value={
+                "version": "v1.0.0",
+                "vendored_at": "2024-01-15T10:30:00Z"
+            }),
+        })
+        
+        result = runner.invoke(app, ["vendor", "status"])
+        
+        assert result.exit_code == 0
+        mocks["meta.commands.vendor.get_vendor_info"].assert_called_once_with(comp_dir)
+    
+    @pytest.mark.parametrize("args, enhanced_result, expected_code, converter", [
+        (["vendored"], (True, {'successful': ['comp1']}), 0, "convert_to_vendored_mode_enhanced"),
+        (["reference"], None, 0, "convert_to_reference_mode"),
+        (["invalid"], None, 1, None),
+        (["vendored", "--dry-run"], (True, {'dry_run': True}), 0, "convert_to_vendored_mode_enhanced"),
+        (["vendored", "--continue-on-error"], (True, {'successful': ['comp1'], 'failed': ['comp2']}), 0,
+         "convert_to_vendored_mode_enhanced"),
+    ], ids=["vendored", "reference", "invalid-mode", "dry-run", "continue-on-error"])
+    def test_vendor_convert(self, runner, temp_meta_repo, mock_vendor, patch_meta,
+                            args, enhanced_result, expected_code, converter):
+        """Test convert command for each mode and option."""
+        mocks = patch_meta({
+            "meta.commands.vendor.convert_to_vendored_mode_enhanced": MagicMock(return_value=enhanced_result),
+            "meta.commands.vendor.convert_to_reference_mode": MagicMock(return_value=True),
+        })
+        
+        result = runner.invoke(app, ["vendor", "convert", *args])
+        
+        assert result.exit_code == expected_code
+        # Only the converter for the requested mode runs; none for a bad mode
+        called = [target.rsplit(".", 1)[1] for target, mock in mocks.items() if mock.called]
+        assert called == ([converter] if converter else [])
+    
+    def test_vendor_release(self, runner, temp_meta_repo, mock_vendor):
         """Test production release command."""
-        runner = CliRunner()
         
-        with patch("meta.utils.vendor.convert_to_vendored_for_production", return_value=True), \
-             patch("meta.utils.git.git_available", return_value=True), \
-             patch("subprocess.run", return_value=MagicMock()):
+        with patch("meta.utils.vendor.convert_to_vendored_for_production", return_value=True):
             
             result = runner.invoke(app, [
                 "vendor", "release", "--env", "prod", "--version", "v1.0.0"
@@ -108,67 +100,46 @@ class TestVendorCommand:
             
             assert result.exit_code == 0
     
-    def test_vendor_release_no_version(self, temp_meta_repo, mock_vendor):
+    def test_vendor_release_no_version(self, runner, temp_meta_repo, mock_vendor):
         """Test production release without version tag."""
-        runner = CliRunner()
         
         with patch("meta.commands.vendor.convert_to_vendored_for_production", return_value=True):
             result = runner.invoke(app, ["vendor", "release", "--env", "prod"])
             
             assert result.exit_code == 0
     
-    def test_vendor_import_component_not_vendored_mode(self, temp_meta_repo, mock_vendor):
+    def test_vendor_import_component_not_vendored_mode(self, runner, temp_meta_repo, mock_vendor,
+                                                       vendor_patches):
         """Test importing component when not in vendored mode."""
-        runner = CliRunner()
+        vendor_patches["is_vendored_mode"].return_value = False
         
-        with patch("meta.commands.vendor.is_vendored_mode", return_value=False):
-            result = runner.invoke(app, [
-                "vendor", "import-component", "test-component"
-            ])
-            
-            assert result.exit_code == 1
+        result = runner.invoke(app, [
+            "vendor", "import-component", "test-component"
+        ])
+        
+        assert result.exit_code == 1
+        vendor_patches["vendor_component"].assert_not_called()
     
-    def test_vendor_status_not_vendored_mode(self, temp_meta_repo, mock_vendor):
+    def test_vendor_status_not_vendored_mode(self, runner, temp_meta_repo, mock_vendor, vendor_patches):
         """Test status command when not in vendored mode."""
-        runner = CliRunner()
+        vendor_patches["is_vendored_mode"].return_value = False
         
-        with patch("meta.commands.vendor.is_vendored_mode", return_value=False):
-            result = runner.invoke(app, ["vendor", "status"])
-            
-            assert result.exit_code == 1
-    
-    def test_vendor_convert_with_dry_run(self, temp_meta_repo, mock_vendor):
-        """Test convert command with dry-run."""
-        runner = CliRunner()
+        result = runner.invoke(app, ["vendor", "status"])
         
-        with patch("meta.commands.vendor.convert_to_vendored_mode_enhanced", return_value=(True, {'dry_run': True})):
-            result = runner.invoke(app, ["vendor", "convert", "vendored", "--dry-run"])
-            
-            assert result.exit_code == 0
-    
-    def test_vendor_convert_with_continue_on_error(self, temp_meta_repo, mock_vendor):
-        """Test convert command with continue-on-error."""
-        runner = CliRunner()
-        
-        with patch("meta.commands.vendor.convert_to_vendored_mode_enhanced", return_value=(True, {'successful': ['comp1'], 'failed': ['comp2']})):
-            result = runner.invoke(app, ["vendor", "convert", "vendored", "--continue-on-error"])
-            
-            assert result.exit_code == 0
+        assert result.exit_code == 1
     
-    def test_vendor_verify(self, temp_meta_repo, mock_vendor):
+    def test_vendor_verify(self, runner, temp_meta_repo, mock_vendor):
         """Test verify command."""
-        runner = CliRunner()
         
         with patch("meta.commands.vendor.verify_conversion", return_value=(True, {'components_valid': 1, 'components_checked': 1})):
             result = runner.invoke(app, ["vendor", "verify"])
             
             assert result.exit_code == 0
     
-    def test_vendor_backup(self, temp_meta_repo, mock_vendor):
+    def test_vendor_backup(self, runner, temp_meta_repo_rw, mock_vendor):
         """Test backup command."""
-        runner = CliRunner()
         
-        backup_path = temp_meta_repo["path"] / ".meta" / "backups" / "test-backup"
+        backup_path = temp_meta_repo_rw["path"] / ".meta" / "backups" / "test-backup"
         backup_path.mkdir(parents=True, exist_ok=True)
         
         with patch("meta.utils.vendor_backup.create_backup", return_value=backup_path):
@@ -176,18 +147,16 @@ class TestVendorCommand:
             
             assert result.exit_code == 0
     
-    def test_vendor_list_backups(self, temp_meta_repo, mock_vendor):
+    def test_vendor_list_backups(self, runner, temp_meta_repo, mock_vendor):
         """Test list-backups command."""
-        runner = CliRunner()
         
         with patch("meta.commands.vendor.list_backups", return_value=[]):
             result = runner.invoke(app, ["vendor", "list-backups"])
             
             assert result.exit_code == 0
     
-    def test_vendor_resume(self, temp_meta_repo, mock_vendor):
+    def test_vendor_resume(self, runner, temp_meta_repo, mock_vendor):
         """Test resume command."""
-        runner = CliRunner()
         
         mock_checkpoint = MagicMock()
         mock_checkpoint.checkpoint_id = "checkpoint-123"
@@ -198,9 +167,8 @@ class TestVendorCommand:
             
             assert result.exit_code == 0
     
-    def test_vendor_list_checkpoints(self, temp_meta_repo, mock_vendor):
+    def test_vendor_list_checkpoints(self, runner, temp_meta_repo, mock_vendor):
         """Test list-checkpoints command."""
-        runner = CliRunner()
         
         with patch("meta.commands.vendor.list_checkpoints", return_value=[]):
             result = runner.invoke(app, ["vendor", "list-checkpoints"])
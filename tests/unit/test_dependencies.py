@@ -9,6 +9,28 @@ from meta.utils.dependencies import (
 )
 
 
+# Shared dependency graphs; the code under test only reads them
+LINEAR_CHAIN = {
+    "component-a": {
+        "depends_on": ["component-b"]
+    },
+    "component-b": {
+        "depends_on": ["component-c"]
+    },
+    "component-c": {
+        "depends_on": []
+    }
+}
+CYCLE_AB = {
+    "component-a": {
+        "depends_on": ["component-b"]
+    },
+    "component-b": {
+        "depends_on": ["component-a"]  # Cycle
+    }
+}
+
+
 class TestDependencyResolution:
     """Tests for dependency resolution."""
     
@@ -46,19 +68,7 @@ class TestDependencyResolution:
     
     def test_resolve_transitive_dependencies(self):
         """Test resolving transitive dependencies."""
-        components = {
-            "component-a": {
-                "depends_on": ["component-b"]
-            },
-            "component-b": {
-                "depends_on": ["component-c"]
-            },
-            "component-c": {
-                "depends_on": []
-            }
-        }
-        
-        deps = resolve_transitive_dependencies("component-a", components)
+        deps = resolve_transitive_dependencies("component-a", LINEAR_CHAIN)
         
         # Should include both direct and transitive
         assert "component-b" in deps
@@ -66,17 +76,8 @@ class TestDependencyResolution:
     
     def test_resolve_transitive_dependencies_no_cycles(self):
         """Test that transitive resolution handles cycles gracefully."""
-        components = {
-            "component-a": {
-                "depends_on": ["component-b"]
-            },
-            "component-b": {
-                "depends_on": ["component-a"]  # Cycle
-            }
-        }
-        
         # Should not infinite loop
-        deps = resolve_transitive_dependencies("component-a", components)
+        deps = resolve_transitive_dependencies("component-a", CYCLE_AB)
         
         # Should at least return direct dependency
         assert "component-b" in deps
@@ -117,14 +118,7 @@ class TestDependencyResolution:
     
     def test_validate_dependencies_cycles(self, monkeypatch):
         """Test validation detects circular dependencies."""
-        monkeypatch.setattr('meta.utils.dependencies.get_components', lambda x: {
-            "component-a": {
-                "depends_on": ["component-b"]
-            },
-            "component-b": {
-                "depends_on": ["component-a"]  # Cycle
-            }
-        })
+        monkeypatch.setattr('meta.utils.dependencies.get_components', lambda x: CYCLE_AB)
         
         valid, errors = validate_dependencies()
         
@@ -134,19 +128,7 @@ class TestDependencyResolution:
     
     def test_get_dependency_order(self):
         """Test getting components in dependency order."""
-        components = {
-            "component-a": {
-                "depends_on": ["component-b"]
-            },
-            "component-b": {
-                "depends_on": ["component-c"]
-            },
-            "component-c": {
-                "depends_on": []
-            }
-        }
-        
-        order = get_dependency_order(components)
+        order = get_dependency_order(LINEAR_CHAIN)
         
         # component-c should come before component-b
         # component-b should come before component-a
@@ -1,7 +1,7 @@
 """Unit tests for deployment utilities."""
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from meta.utils.deployment import DeploymentManager, get_deployment_manager
 
 
@@ -0,0 +1,80 @@
+"""Unit tests for the test dependency injection container."""
+
+import pytest
+from unittest.mock import Mock
+from tests.fixtures.di_container import DIContainer
+
+
+def _git_factory():
+    return Mock(**{"checkout_version.return_value": True})
+
+
+class TestDIContainer:
+    """Tests for sharing a container across tests."""
+    
+    def test_get_builds_once(self):
+        """Test that a factory-built service is reused."""
+        container = DIContainer()
+        container.register_factory("git", _git_factory)
+        
+        assert container.get("git") is container.get("git")
+    
+    def test_restore_state_keeps_built_services(self):
+        """Test that services built during a test survive restore_state."""
+        container = DIContainer()
+        container.register_factory("git", _git_factory)
+        
+        state = container.save_state()
+        git = container.get("git")
+        container.restore_state(state)
+        
+        assert container.get("git") is git
+    
+    def test_restore_state_rolls_back_registrations(self):
+        """Test that services and factories registered in a test are dropped."""
+        container = DIContainer()
+        container.register_factory("git", _git_factory)
+        git = container.get("git")
+        
+        state = container.save_state()
+        container.register("git", Mock())
+        container.register_factory("bazel", Mock)
+        container.restore_state(state)
+        
+        assert container.get("git") is git
+        with pytest.raises(KeyError):
+            container.get("bazel")
+    
+    def test_reset_mocks_keeps_configuration(self):
+        """Test that reset_mocks clears call records but not return values."""
+        container = DIContainer()
+        container.register_factory("git", _git_factory)
+        git = container.get("git")
+        git.checkout_version("test-component", "v1.0.0")
+        
+        container.reset_mocks()
+        
+        assert git.checkout_version.call_count == 0
+        assert git.checkout_version() is True
+    
+    def test_reset_mocks_skips_services_not_fetched(self):
+        """Test that only services fetched since the last reset are reset."""
+        container = DIContainer()
+        container.register_factory("git", _git_factory)
+        git = container.get("git")
+        container.reset_mocks()
+        
+        git.checkout_version("test-component", "v1.0.0")
+        container.reset_mocks()
+        
+        assert git.checkout_version.call_count == 1
+    
+    def test_shared_container(self, di_container, _session_di_container):
+        """Test that di_container hands out the session container."""
+        assert di_container is _session_di_container
+    
+    @pytest.mark.isolated_di
+    def test_isolated_di_marker(self, di_container, _session_di_container):
+        """Test that isolated_di tests get their own container."""
+        assert di_container is not _session_di_container
+        assert di_container.get("git") is not _session_di_container.get("git")
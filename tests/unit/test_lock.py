@@ -4,7 +4,7 @@ import pytest
 import yaml
 import tempfile
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from meta.utils.lock import (
     generate_lock_file,
     load_lock_file,
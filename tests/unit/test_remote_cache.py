@@ -1,7 +1,6 @@
 """Unit tests for remote cache backends."""
 
 import pytest
-from unittest.mock import MagicMock, patch
 from meta.utils.remote_cache import S3Backend, GCSBackend, create_remote_backend
 
 
@@ -58,20 +58,21 @@ components:
                 # May return empty list if no targets found, or list with targets
                 assert isinstance(targets, list)
     
-    def test_rollback_component(self):
+    def test_rollback_component(self, monkeypatch):
         """Test rolling back a component."""
         with tempfile.TemporaryDirectory() as tmpdir:
             comp_dir = Path(tmpdir) / "components" / "test-component"
             comp_dir.mkdir(parents=True)
             # Make it a git repo
             (comp_dir / ".git").mkdir()
+            # rollback_component looks for components/ under the working directory
+            monkeypatch.chdir(tmpdir)
             
             target = RollbackTarget("test-component", version="v1.0.0")
             
             with patch('meta.utils.rollback.checkout_version', return_value=True), \
                  patch('meta.utils.manifest.get_components') as mock_get_components, \
-                 patch('meta.utils.manifest.find_meta_repo_root', return_value=Path(tmpdir)), \
-                 patch('pathlib.Path.exists', new=lambda self: True if ("test-component" in str(self) or ".git" in str(self)) else Path(str(self)).exists()):
+                 patch('meta.utils.manifest.find_meta_repo_root', return_value=Path(tmpdir)):
                 
                 mock_get_components.return_value = {
                     "test-component": {
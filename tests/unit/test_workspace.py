@@ -0,0 +1,54 @@
+"""Tests for workspace utilities."""
+
+from unittest.mock import patch
+from meta.utils.workspace import WorkspaceManager
+
+
+class TestWorkspaceManager:
+    """Test workspace manager persistence."""
+    
+    def test_changes_replayed_from_log(self, tmp_path):
+        """Test that workspace changes survive a reload via the change log."""
+        config_file = tmp_path / ".meta" / "workspace.yaml"
+        manager = WorkspaceManager(str(config_file))
+        
+        assert manager.create_workspace("alpha")
+        assert manager.create_workspace("beta", manifests_dir="custom")
+        assert manager.log_file.exists()
+        assert not config_file.exists()
+        
+        reloaded = WorkspaceManager(str(config_file))
+        assert list(reloaded.list_workspaces()) == ["alpha", "beta"]
+        assert reloaded.list_workspaces()["beta"]["manifests_dir"] == "custom"
+        assert reloaded.list_workspaces()["beta"]["created_at"].endswith("Z")
+    
+    def test_log_compacted_into_snapshot(self, tmp_path):
+        """Test that the change log is folded into the YAML snapshot."""
+        config_file = tmp_path / ".meta" / "workspace.yaml"
+        manager = WorkspaceManager(str(config_file))
+        
+        manager.create_workspace("alpha")
+        manager.delete_workspace("alpha")
+        
+        assert config_file.exists()
+        assert not manager.log_file.exists()
+        assert WorkspaceManager(str(config_file)).list_workspaces() == {}
+    
+    def test_unchanged_config_not_reparsed(self, tmp_path):
+        """Test that a new manager reuses the parse while files are unchanged."""
+        config_file = tmp_path / ".meta" / "workspace.yaml"
+        config_file.parent.mkdir(parents=True)
+        config_file.write_text("alpha:\n  manifests_dir: manifests-alpha\n")
+        
+        assert list(WorkspaceManager(str(config_file)).list_workspaces()) == ["alpha"]
+        with patch("meta.utils.workspace.yaml.load") as mock_load:
+            manager = WorkspaceManager(str(config_file))
+            mock_load.assert_not_called()
+        assert list(manager.list_workspaces()) == ["alpha"]
+        
+        manager.create_workspace("beta")
+        assert list(WorkspaceManager(str(config_file)).list_workspaces()) == ["alpha", "beta"]
+        
+        config_file.write_text("gamma: {}\n")
+        manager.log_file.unlink()
+        assert list(WorkspaceManager(str(config_file)).list_workspaces()) == ["gamma"]
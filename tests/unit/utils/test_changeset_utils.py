@@ -1,22 +1,21 @@
 """Tests for changeset utilities with dependency injection."""
 import pytest
-import tempfile
-from pathlib import Path
-from unittest.mock import patch, MagicMock
-from datetime import datetime
+from unittest.mock import patch
 
 
 class TestChangesetUtils:
     """Tests for changeset utility functions."""
     
-    def test_create_changeset(self, temp_meta_repo):
+    def test_create_changeset(self, temp_meta_repo_rw, monkeypatch):
         """Test creating a changeset."""
         from meta.utils.changeset import create_changeset
         from pathlib import Path
         
-        # Create actual changeset directory
-        changeset_dir = temp_meta_repo["path"] / ".meta" / "changesets"
+        # Create actual changeset directory; the changeset helpers resolve
+        # .meta/changesets against the working directory
+        changeset_dir = temp_meta_repo_rw["path"] / ".meta" / "changesets"
         changeset_dir.mkdir(parents=True, exist_ok=True)
+        monkeypatch.chdir(temp_meta_repo_rw["path"])
         
         changeset = create_changeset("Test changeset", "test@example.com")
         
@@ -25,14 +24,15 @@ class TestChangesetUtils:
         assert changeset.author == "test@example.com"
         assert changeset.status == "in-progress"
     
-    def test_load_changeset(self, temp_meta_repo):
+    def test_load_changeset(self, temp_meta_repo_rw, monkeypatch):
         """Test loading a changeset."""
         from meta.utils.changeset import load_changeset, save_changeset, create_changeset
         import yaml
         
         # Create actual changeset directory
-        changeset_dir = temp_meta_repo["path"] / ".meta" / "changesets"
+        changeset_dir = temp_meta_repo_rw["path"] / ".meta" / "changesets"
         changeset_dir.mkdir(parents=True, exist_ok=True)
+        monkeypatch.chdir(temp_meta_repo_rw["path"])
         
         changeset = create_changeset("Test changeset")
         save_changeset(changeset)
@@ -105,23 +105,22 @@ changesets:
         # Test with multiple IDs (should get first)
         assert extract_changeset_id_from_message("[changeset:abc123] [changeset:def456]") == "abc123"
     
-    def test_get_current_changeset(self, temp_meta_repo):
+    def test_get_current_changeset(self, temp_meta_repo_rw, monkeypatch):
         """Test getting current changeset."""
-        from meta.utils.changeset import get_current_changeset, Changeset
-        
-        with patch('meta.utils.changeset.CHANGESET_DIR') as mock_dir:
-            mock_file = MagicMock()
-            mock_file.exists.return_value = True
-            mock_file.read_text.return_value = "changeset-123"
-            (mock_dir / "current").__truediv__ = lambda x, y: mock_file
-            mock_dir.__truediv__ = lambda x, y: mock_file
-            
-            with patch('meta.utils.changeset.load_changeset') as mock_load:
-                mock_changeset = Changeset("changeset-123", "Test")
-                mock_load.return_value = mock_changeset
-                
-                current = get_current_changeset()
-                
-                assert current is not None
-                assert current.id == "changeset-123"
+        from meta.utils.changeset import get_current_changeset, create_changeset, save_changeset
+        
+        # Create actual changeset directory
+        changeset_dir = temp_meta_repo_rw["path"] / ".meta" / "changesets"
+        changeset_dir.mkdir(parents=True, exist_ok=True)
+        monkeypatch.chdir(temp_meta_repo_rw["path"])
+        
+        committed = create_changeset("Committed changeset")
+        committed.status = "committed"
+        save_changeset(committed)
+        in_progress = create_changeset("Test changeset")
+        
+        current = get_current_changeset()
+        
+        assert current is not None
+        assert current.id == in_progress.id
 
@@ -1,6 +1,6 @@
 """Tests for dependency utilities with dependency injection."""
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 
 class TestDependencyUtils:
@@ -38,8 +38,7 @@ class TestDependencyUtils:
             "component-b": {}
         }
         
-        with patch('meta.utils.dependencies.get_components', return_value=components), \
-             patch('pathlib.Path.exists', return_value=True):
+        with patch('meta.utils.dependencies.get_components', return_value=components):
             
             result, errors = validate_dependencies("manifests")
             
@@ -1,8 +1,6 @@
 """Tests for git utilities with dependency injection."""
 import pytest
-import tempfile
-from pathlib import Path
-from unittest.mock import patch, MagicMock, Mock
+from unittest.mock import patch, MagicMock
 
 
 class TestGitUtils:
@@ -39,11 +37,11 @@ class TestGitUtils:
             assert result is True
             mock_subprocess.assert_called()
     
-    def test_clone_repo_already_exists(self, temp_meta_repo):
+    def test_clone_repo_already_exists(self, temp_meta_repo_rw):
         """Test cloning when directory already exists."""
         from meta.utils.git import clone_repo
         
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir()
         
         with patch('meta.utils.git.git_available', return_value=True):
@@ -56,11 +54,11 @@ class TestGitUtils:
             # Should return True if directory exists
             assert result is True
     
-    def test_checkout_version(self, temp_meta_repo, mock_git):
+    def test_checkout_version(self, temp_meta_repo_rw, mock_git):
         """Test checking out a version."""
         from meta.utils.git import checkout_version
         
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir()
         
         with patch('meta.utils.git.git_available', return_value=True), \
@@ -75,11 +73,11 @@ class TestGitUtils:
             assert result is True
             mock_subprocess.assert_called()
     
-    def test_get_commit_sha_for_ref(self, temp_meta_repo, mock_git):
+    def test_get_commit_sha_for_ref(self, temp_meta_repo_rw, mock_git):
         """Test getting commit SHA for a reference."""
         from meta.utils.git import get_commit_sha_for_ref
         
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir()
         
         with patch('meta.utils.git.git_available', return_value=True), \
@@ -95,11 +93,11 @@ class TestGitUtils:
             assert sha == "abc123def456"
             mock_subprocess.assert_called()
     
-    def test_get_current_version(self, temp_meta_repo, mock_git):
+    def test_get_current_version(self, temp_meta_repo_rw, mock_git):
         """Test getting current version."""
         from meta.utils.git import get_current_version
         
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir()
         
         with patch('meta.utils.git.git_available', return_value=True), \
@@ -114,11 +112,11 @@ class TestGitUtils:
             
             assert version == "v1.0.0"
     
-    def test_get_current_version_not_git_repo(self, temp_meta_repo):
+    def test_get_current_version_not_git_repo(self, temp_meta_repo_rw):
         """Test getting current version from non-git directory."""
         from meta.utils.git import get_current_version
         
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir()
         
         with patch('meta.utils.git.git_available', return_value=True), \
@@ -132,11 +130,11 @@ class TestGitUtils:
             
             assert version is None
     
-    def test_pull_latest(self, temp_meta_repo, mock_git):
+    def test_pull_latest(self, temp_meta_repo_rw, mock_git):
         """Test pulling latest changes."""
         from meta.utils.git import pull_latest
         
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir()
         
         with patch('meta.utils.git.git_available', return_value=True), \
@@ -1,9 +1,6 @@
 """Tests for manifest utilities with dependency injection."""
 import pytest
-import tempfile
-import yaml
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 
 class TestManifestUtils:
@@ -18,6 +15,17 @@ class TestManifestUtils:
         assert root is not None
         assert (root / "manifests" / "components.yaml").exists()
     
+    def test_find_meta_repo_root_cached(self, temp_meta_repo):
+        """Test that a found root is served from the cache."""
+        from meta.utils.manifest import find_meta_repo_root
+        
+        start = str(temp_meta_repo["components"])
+        root = find_meta_repo_root(start)
+        
+        with patch("meta.utils.manifest.Path.resolve") as mock_resolve:
+            assert find_meta_repo_root(start) == root
+            mock_resolve.assert_not_called()
+    
     def test_load_yaml(self, temp_meta_repo):
         """Test loading YAML file."""
         from meta.utils.manifest import load_yaml
@@ -35,12 +43,12 @@ class TestManifestUtils:
         with pytest.raises(FileNotFoundError):
             load_yaml("nonexistent.yaml")
     
-    def test_get_components(self, temp_meta_repo):
+    def test_get_components(self, temp_meta_repo_rw):
         """Test getting components from manifest."""
         from meta.utils.manifest import get_components
         
         # Write test components
-        components_file = temp_meta_repo["manifests"] / "components.yaml"
+        components_file = temp_meta_repo_rw["manifests"] / "components.yaml"
         components_file.write_text("""
 components:
   test-component:
@@ -49,17 +57,33 @@ components:
     type: "bazel"
 """)
         
-        components = get_components(str(temp_meta_repo["manifests"]))
+        components = get_components(str(temp_meta_repo_rw["manifests"]))
         
         assert "test-component" in components
         assert components["test-component"]["version"] == "v1.0.0"
     
-    def test_get_features(self, temp_meta_repo):
+    def test_get_components_cached(self, temp_meta_repo_rw):
+        """Test that cached components are reused until the manifest changes."""
+        from meta.utils.manifest import get_components_cached
+        
+        components_file = temp_meta_repo_rw["manifests"] / "components.yaml"
+        components_file.write_text("components:\n  a: {version: v1.0.0}\n")
+        manifests_dir = str(temp_meta_repo_rw["manifests"])
+        
+        first = get_components_cached(manifests_dir)
+        assert get_components_cached(manifests_dir) is first
+        with pytest.raises(TypeError):
+            first["b"] = {}
+        
+        components_file.write_text("components:\n  a: {version: v1.0.0}\n  b: {version: v2.0.0}\n")
+        assert "b" in get_components_cached(manifests_dir)
+    
+    def test_get_features(self, temp_meta_repo_rw):
         """Test getting features from manifest."""
         from meta.utils.manifest import get_features
         
         # Write test features
-        features_file = temp_meta_repo["manifests"] / "features.yaml"
+        features_file = temp_meta_repo_rw["manifests"] / "features.yaml"
         features_file.write_text("""
 features:
   test-feature:
@@ -68,17 +92,17 @@ features:
     description: "Test feature"
 """)
         
-        features = get_features(str(temp_meta_repo["manifests"]))
+        features = get_features(str(temp_meta_repo_rw["manifests"]))
         
         assert "test-feature" in features
         assert "test-component" in features["test-feature"]["components"]
     
-    def test_get_environment_config(self, temp_meta_repo):
+    def test_get_environment_config(self, temp_meta_repo_rw):
         """Test getting environment configuration."""
         from meta.utils.manifest import get_environment_config
         
         # Write test environments
-        env_file = temp_meta_repo["manifests"] / "environments.yaml"
+        env_file = temp_meta_repo_rw["manifests"] / "environments.yaml"
         env_file.write_text("""
 environments:
   dev:
@@ -87,16 +111,16 @@ environments:
     test-component: "v1.0.0"
 """)
         
-        dev_config = get_environment_config("dev", str(temp_meta_repo["manifests"]))
+        dev_config = get_environment_config("dev", str(temp_meta_repo_rw["manifests"]))
         
         assert "test-component" in dev_config
         assert dev_config["test-component"] == "v1.0.0"
     
-    def test_load_yaml_invalid(self, temp_meta_repo):
+    def test_load_yaml_invalid(self, temp_meta_repo_rw):
         """Test loading invalid YAML file."""
         from meta.utils.manifest import load_yaml
         
-        invalid_file = temp_meta_repo["manifests"] / "invalid.yaml"
+        invalid_file = temp_meta_repo_rw["manifests"] / "invalid.yaml"
         invalid_file.write_text("invalid: yaml: content: [")
         
         with pytest.raises(Exception):  # Should raise YAMLError
@@ -1,7 +1,7 @@
 """Tests for secret detection utilities."""
 
 import pytest
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import patch
 from pathlib import Path
 from meta.utils.secret_detection import (
     scan_file_for_secrets,
@@ -14,17 +14,17 @@ from meta.utils.secret_detection import (
 class TestSecretDetection:
     """Test secret detection utilities."""
     
-    def test_scan_file_for_secrets_no_secrets(self, temp_meta_repo):
+    def test_scan_file_for_secrets_no_secrets(self, temp_meta_repo_rw):
         """Test scanning file with no secrets."""
-        test_file = temp_meta_repo["components"] / "test.py"
+        test_file = temp_meta_repo_rw["components"] / "test.py"
         test_file.write_text("def hello():\n    print('world')")
         
         secrets = scan_file_for_secrets(test_file)
         assert secrets == []
     
-    def test_scan_file_for_secrets_finds_api_key(self, temp_meta_repo):
+    def test_scan_file_for_secrets_finds_api_key(self, temp_meta_repo_rw):
         """Test scanning file with API key."""
-        test_file = temp_meta_repo["components"] / "config.py"
+        test_file = temp_meta_repo_rw["components"] / "config.py"
         # Use obviously fake test value that won't trigger GitHub's secret scanner
         test_file.write_text('api_key = "test_fake_api_key_for_testing_only_1234567890abcdef"')
         
@@ -32,9 +32,9 @@ class TestSecretDetection:
         assert len(secrets) > 0
         assert any(s['type'] == 'api_key' for s in secrets)
     
-    def test_scan_file_for_secrets_finds_password(self, temp_meta_repo):
+    def test_scan_file_for_secrets_finds_password(self, temp_meta_repo_rw):
         """Test scanning file with password."""
-        test_file = temp_meta_repo["components"] / "config.py"
+        test_file = temp_meta_repo_rw["components"] / "config.py"
         test_file.write_text('password = "mysecretpassword123"')
         
         secrets = scan_file_for_secrets(test_file)
@@ -62,11 +62,11 @@ class TestSecretDetection:
         assert should_exclude_file(file_path) is False
     
     @patch("meta.utils.secret_detection.scan_file_for_secrets")
-    def test_scan_directory_for_secrets(self, mock_scan_file, temp_meta_repo):
+    def test_scan_directory_for_secrets(self, mock_scan_file, temp_meta_repo_rw):
         """Test scanning directory for secrets."""
         mock_scan_file.return_value = []
         
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir()
         (comp_dir / "file1.py").write_text("code")
         (comp_dir / "file2.py").write_text("code")
@@ -76,9 +76,9 @@ class TestSecretDetection:
         assert results['total_secrets'] == 0
         assert results['total_files_scanned'] >= 0
     
-    def test_detect_secrets_in_component_safe(self, temp_meta_repo):
+    def test_detect_secrets_in_component_safe(self, temp_meta_repo_rw):
         """Test detecting secrets in safe component."""
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir()
         (comp_dir / "main.py").write_text("def hello(): pass")
         
@@ -87,9 +87,9 @@ class TestSecretDetection:
         assert is_safe is True
         assert results['total_secrets'] == 0
     
-    def test_detect_secrets_in_component_with_secrets(self, temp_meta_repo):
+    def test_detect_secrets_in_component_with_secrets(self, temp_meta_repo_rw):
         """Test detecting secrets in component with secrets."""
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir()
         # Use obviously fake test value that won't trigger GitHub's secret scanner
         (comp_dir / "config.py").write_text('api_key = "test_fake_api_key_for_testing_only_1234567890abcdef"')
@@ -99,9 +99,9 @@ class TestSecretDetection:
         assert is_safe is False
         assert results['total_secrets'] > 0
     
-    def test_detect_secrets_in_component_fail_on_secrets(self, temp_meta_repo):
+    def test_detect_secrets_in_component_fail_on_secrets(self, temp_meta_repo_rw):
         """Test failing when secrets detected."""
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir()
         # Use obviously fake test value that won't trigger GitHub's secret scanner
         (comp_dir / "config.py").write_text('api_key = "test_fake_api_key_for_testing_only_1234567890abcdef"')
@@ -110,3 +110,28 @@ class TestSecretDetection:
         
         assert is_safe is False
         assert results['total_secrets'] > 0
+    
+    def test_scan_directory_skips_excluded_directories(self, temp_meta_repo_rw):
+        """Test that excluded directories are not descended into."""
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
+        (comp_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (comp_dir / "node_modules" / "pkg" / "index.js").write_text('password = "mysecretpassword123"')
+        (comp_dir / "main.py").write_text("def hello(): pass")
+        
+        results = scan_directory_for_secrets(comp_dir)
+        
+        assert results['total_files_scanned'] == 1
+        assert results['total_secrets'] == 0
+    
+    def test_scan_directory_scans_suffix_named_directories(self, temp_meta_repo_rw):
+        """Test that file suffix patterns like *.so do not prune directories."""
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
+        for dir_name in ("lib.so", "ok"):
+            (comp_dir / dir_name).mkdir(parents=True)
+            (comp_dir / dir_name / "config.py").write_text('password = "mysecretpassword123"')
+        (comp_dir / "native.so").write_text('password = "mysecretpassword123"')
+        
+        results = scan_directory_for_secrets(comp_dir)
+        
+        assert results['total_files_scanned'] == 2
+        assert {Path(secret['file']).parent.name for secret in results['secrets_found']} == {"lib.so", "ok"}
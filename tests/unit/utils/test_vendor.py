@@ -1,5 +1,6 @@
 """Tests for vendor utilities."""
 
+import json
 import pytest
 from unittest.mock import patch, MagicMock, mock_open
 from pathlib import Path
@@ -9,9 +10,12 @@ from meta.utils.vendor import (
     vendor_component,
     get_vendor_info,
     is_component_vendored,
+    get_vendored_components,
     convert_to_vendored_mode,
     convert_to_reference_mode,
-    convert_to_vendored_for_production
+    convert_to_vendored_for_production,
+    compute_file_hashes,
+    verify_conversion
 )
 
 
@@ -38,9 +42,9 @@ components: {}
         
         assert is_vendored_mode(temp_manifests) is False
     
-    def test_get_vendor_info(self, temp_meta_repo):
+    def test_get_vendor_info(self, temp_meta_repo_rw):
         """Test getting vendor info."""
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir()
         
         vendor_info = {
@@ -57,17 +61,17 @@ components: {}
         result = get_vendor_info(comp_dir)
         assert result == vendor_info
     
-    def test_get_vendor_info_not_vendored(self, temp_meta_repo):
+    def test_get_vendor_info_not_vendored(self, temp_meta_repo_rw):
         """Test getting vendor info when not vendored."""
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir()
         
         result = get_vendor_info(comp_dir)
         assert result is None
     
-    def test_is_component_vendored_true(self, temp_meta_repo):
+    def test_is_component_vendored_true(self, temp_meta_repo_rw):
         """Test checking if component is vendored."""
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir()
         
         vendor_info = {
@@ -80,41 +84,53 @@ components: {}
         with open(vendor_info_path, 'w') as f:
             yaml.dump(vendor_info, f)
         
-        with patch("meta.utils.vendor.find_meta_repo_root", return_value=temp_meta_repo["path"]):
+        with patch("meta.utils.vendor.find_meta_repo_root", return_value=temp_meta_repo_rw["path"]):
             result = is_component_vendored("test-component")
             assert result is True
     
-    def test_is_component_vendored_false(self, temp_meta_repo):
+    def test_is_component_vendored_false(self, temp_meta_repo_rw):
         """Test checking if component is not vendored."""
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir()
         
-        with patch("meta.utils.vendor.find_meta_repo_root", return_value=temp_meta_repo["path"]):
+        with patch("meta.utils.vendor.find_meta_repo_root", return_value=temp_meta_repo_rw["path"]):
             result = is_component_vendored("test-component")
             assert result is False
     
+    def test_get_vendored_components(self, temp_meta_repo_rw):
+        """Test batch vendored check over the components directory."""
+        for name in ("vendored-comp", "plain-comp", "unlisted-comp"):
+            (temp_meta_repo_rw["components"] / name).mkdir()
+        (temp_meta_repo_rw["components"] / "vendored-comp" / ".vendor-info.yaml").write_text("component: vendored-comp\n")
+        (temp_meta_repo_rw["components"] / "unlisted-comp" / ".vendor-info.yaml").write_text("component: unlisted-comp\n")
+        
+        with patch("meta.utils.vendor.find_meta_repo_root", return_value=temp_meta_repo_rw["path"]):
+            result = get_vendored_components(["vendored-comp", "plain-comp", "missing-comp"])
+        
+        assert result == {"vendored-comp"}
+    
     @patch("meta.utils.vendor.git_available", return_value=True)
+    @patch("meta.utils.vendor.get_commit_sha", return_value="abc123def456")
     @patch("meta.utils.vendor.find_meta_repo_root")
     @patch("meta.utils.vendor.subprocess.run")
     @patch("shutil.copytree")
     @patch("shutil.rmtree")
     @patch("tempfile.TemporaryDirectory")
-    @patch("pathlib.Path.exists")
     @patch("builtins.open", new_callable=mock_open)
-    def test_vendor_component(self, mock_file, mock_exists, mock_tmpdir, mock_rmtree, mock_copytree, 
-                              mock_subprocess, mock_find_root, mock_git_available, temp_meta_repo):
+    def test_vendor_component(self, mock_file, mock_tmpdir, mock_rmtree, mock_copytree, 
+                              mock_subprocess, mock_find_root, mock_get_commit_sha,
+                              mock_git_available, temp_meta_repo_rw):
         """Test vendoring a component."""
-        mock_find_root.return_value = temp_meta_repo["path"]
+        mock_find_root.return_value = temp_meta_repo_rw["path"]
         mock_subprocess.return_value = MagicMock(returncode=0)
-        mock_exists.return_value = False  # Component doesn't exist yet
         
         # Mock temporary directory
-        tmp_path = temp_meta_repo["path"] / "tmp"
+        tmp_path = temp_meta_repo_rw["path"] / "tmp"
         mock_tmpdir.return_value.__enter__.return_value = str(tmp_path)
         mock_tmpdir.return_value.__exit__.return_value = None
         
         # Ensure component directory exists
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir(parents=True, exist_ok=True)
         
         comp = {
@@ -125,6 +141,9 @@ components: {}
         result = vendor_component("test-component", comp)
         
         assert result is True
+        # The checked-out commit is recorded before .git is removed
+        written = "".join(call.args[0] for call in mock_file().write.call_args_list)
+        assert yaml.safe_load(written)["commit"] == "abc123def456"
     
     @patch("meta.utils.vendor.is_vendored_mode", return_value=False)
     @patch("meta.utils.vendor.find_meta_repo_root")
@@ -133,9 +152,9 @@ components: {}
     @patch("builtins.open", new_callable=mock_open, read_data="components:\n  test-component: {}")
     def test_convert_to_vendored_mode(self, mock_file, mock_vendor,
                                       mock_get_components, mock_find_root,
-                                      mock_is_vendored, temp_meta_repo):
+                                      mock_is_vendored, temp_meta_repo_rw):
         """Test converting to vendored mode."""
-        mock_find_root.return_value = temp_meta_repo["path"]
+        mock_find_root.return_value = temp_meta_repo_rw["path"]
         mock_get_components.return_value = {
             "test-component": {
                 "repo": "git@github.com:test/test.git",
@@ -143,17 +162,56 @@ components: {}
             }
         }
         
-        components_yaml = temp_meta_repo["manifests"] / "components.yaml"
+        components_yaml = temp_meta_repo_rw["manifests"] / "components.yaml"
         components_yaml.write_text("components:\n  test-component: {}")
         
         # Create component directory with .git to simulate git repo
-        comp_dir = temp_meta_repo["components"] / "test-component"
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
         comp_dir.mkdir(parents=True, exist_ok=True)
         (comp_dir / ".git").mkdir()
         
-        result = convert_to_vendored_mode(str(temp_meta_repo["manifests"]))
+        result = convert_to_vendored_mode(str(temp_meta_repo_rw["manifests"]))
+        
+        assert result is True
+    
+    @patch("meta.utils.vendor.is_vendored_mode", return_value=False)
+    @patch("meta.utils.vendor.find_meta_repo_root")
+    @patch("meta.utils.vendor.get_components")
+    @patch("meta.utils.vendor.vendor_component")
+    def test_convert_journals_vendored_commit(self, mock_vendor, mock_get_components,
+                                              mock_find_root, mock_is_vendored, temp_meta_repo_rw):
+        """Test that the checkpoint journal records the commit each component was vendored from."""
+        from meta.utils.vendor import convert_to_vendored_mode_internal
+        from meta.utils.vendor_resume import create_checkpoint
+        
+        mock_find_root.return_value = temp_meta_repo_rw["path"]
+        mock_get_components.return_value = {
+            "test-component": {
+                "repo": "git@github.com:test/test.git",
+                "version": "v1.0.0"
+            }
+        }
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
+        
+        def vendor(name, *args, **kwargs):
+            comp_dir.mkdir()
+            (comp_dir / ".vendor-info.yaml").write_text("component: test-component\ncommit: abc123def456\n")
+            return True
+        
+        mock_vendor.side_effect = vendor
+        resume_dir = temp_meta_repo_rw["path"] / ".meta" / "resume"
+        
+        with patch("meta.utils.vendor_resume.RESUME_DIR", resume_dir):
+            checkpoint = create_checkpoint("vendored", "manifests", checkpoint_id="checkpoint-sha")
+            checkpoint.pending_components = ["test-component"]
+            
+            result = convert_to_vendored_mode_internal(str(temp_meta_repo_rw["manifests"]),
+                                                       checkpoint=checkpoint)
+            checkpoint.sync_log()
         
         assert result is True
+        log_lines = (resume_dir / "checkpoint-sha" / "checkpoint.log").read_text().splitlines()
+        assert json.loads(log_lines[0])["sha"] == "abc123def456"
     
     @patch("meta.utils.vendor.is_vendored_mode", return_value=True)
     @patch("meta.utils.vendor.git_available", return_value=True)
@@ -163,14 +221,13 @@ components: {}
     @patch("meta.utils.vendor.clone_repo", return_value=True)
     @patch("meta.utils.vendor.checkout_version", return_value=True)
     @patch("shutil.rmtree")
-    @patch("pathlib.Path.exists")
     @patch("builtins.open", new_callable=mock_open, read_data="meta:\n  mode: vendored\ncomponents:\n  test-component: {}")
-    def test_convert_to_reference_mode(self, mock_file, mock_exists, mock_rmtree,
+    def test_convert_to_reference_mode(self, mock_file, mock_rmtree,
                                       mock_checkout, mock_clone, mock_get_vendor_info,
                                       mock_get_components, mock_find_root,
-                                      mock_git_available, mock_is_vendored, temp_meta_repo):
+                                      mock_git_available, mock_is_vendored, temp_meta_repo_rw):
         """Test converting to reference mode."""
-        mock_find_root.return_value = temp_meta_repo["path"]
+        mock_find_root.return_value = temp_meta_repo_rw["path"]
         mock_get_components.return_value = {
             "test-component": {
                 "repo": "git@github.com:test/test.git",
@@ -181,12 +238,12 @@ components: {}
             "repo": "git@github.com:test/test.git",
             "version": "v1.0.0"
         }
-        mock_exists.return_value = True
         
-        components_yaml = temp_meta_repo["manifests"] / "components.yaml"
+        components_yaml = temp_meta_repo_rw["manifests"] / "components.yaml"
         components_yaml.write_text("meta:\n  mode: vendored\ncomponents:\n  test-component: {}")
+        (temp_meta_repo_rw["components"] / "test-component").mkdir()
         
-        result = convert_to_reference_mode(str(temp_meta_repo["manifests"]))
+        result = convert_to_reference_mode(str(temp_meta_repo_rw["manifests"]))
         
         assert result is True
     
@@ -200,9 +257,9 @@ components: {}
     def test_convert_to_vendored_for_production(self, mock_file, mock_rmtree,
                                                  mock_generate_lock, mock_vendor,
                                                  mock_find_root, mock_get_components,
-                                                 mock_get_env_config, temp_meta_repo):
+                                                 mock_get_env_config, temp_meta_repo_rw):
         """Test converting to vendored mode for production."""
-        mock_find_root.return_value = temp_meta_repo["path"]
+        mock_find_root.return_value = temp_meta_repo_rw["path"]
         mock_get_components.return_value = {
             "test-component": {
                 "repo": "git@github.com:test/test.git",
@@ -213,10 +270,45 @@ components: {}
             "test-component": "v1.2.3"  # Production version
         }
         
-        components_yaml = temp_meta_repo["manifests"] / "components.yaml"
+        components_yaml = temp_meta_repo_rw["manifests"] / "components.yaml"
         components_yaml.write_text("components:\n  test-component: {}")
         
-        result = convert_to_vendored_for_production("prod", str(temp_meta_repo["manifests"]))
+        result = convert_to_vendored_for_production("prod", str(temp_meta_repo_rw["manifests"]))
         
         assert result is True
 
+    
+    def test_compute_file_hashes(self, temp_meta_repo_rw):
+        """Test hashing vendored files, excluding the vendor info file."""
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
+        (comp_dir / "src").mkdir(parents=True)
+        (comp_dir / "src" / "main.py").write_text("print('hello')")
+        (comp_dir / ".vendor-info.yaml").write_text("component: test-component")
+        
+        hashes = compute_file_hashes(comp_dir)
+        
+        assert list(hashes) == ["src/main.py"]
+        assert len(hashes["src/main.py"]) == 64
+    
+    @patch("meta.utils.vendor.is_vendored_mode", return_value=True)
+    @patch("meta.utils.vendor.find_meta_repo_root")
+    @patch("meta.utils.vendor.get_components")
+    def test_verify_conversion_detects_modified_file(self, mock_get_components, mock_find_root,
+                                                     mock_is_vendored, temp_meta_repo_rw):
+        """Test integrity check against hashes stored in vendor info."""
+        mock_find_root.return_value = temp_meta_repo_rw["path"]
+        mock_get_components.return_value = {"test-component": {"version": "v1.0.0"}}
+        
+        comp_dir = temp_meta_repo_rw["components"] / "test-component"
+        comp_dir.mkdir()
+        (comp_dir / "main.py").write_text("print('hello')")
+        vendor_info = {"version": "v1.0.0", "files": compute_file_hashes(comp_dir)}
+        (comp_dir / ".vendor-info.yaml").write_text(yaml.dump(vendor_info))
+        
+        is_valid, _ = verify_conversion(check_integrity=True)
+        assert is_valid is True
+        
+        (comp_dir / "main.py").write_text("print('tampered')")
+        is_valid, details = verify_conversion(check_integrity=True)
+        assert is_valid is False
+        assert "Component test-component file modified: main.py" in details['errors']
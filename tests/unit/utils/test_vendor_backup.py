@@ -2,13 +2,19 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
-from pathlib import Path
+import errno
 import json
+import shutil
 from meta.utils.vendor_backup import (
     create_backup,
     list_backups,
     restore_backup,
-    get_latest_backup
+    get_latest_backup,
+    _fast_copytree,
+    _fast_rmtree,
+    _try_reflink_tree,
+    _snapshot_tree,
+    _estimate_tree
 )
 
 
@@ -16,14 +22,14 @@ class TestVendorBackup:
     """Test vendor backup utilities."""
     
     @patch("meta.utils.vendor_backup.find_meta_repo_root")
-    @patch("shutil.copytree")
+    @patch("meta.utils.vendor_backup._fast_copytree")
     @patch("builtins.open", create=True)
-    def test_create_backup(self, mock_open, mock_copytree, mock_find_root, temp_meta_repo):
+    def test_create_backup(self, mock_open, mock_copytree, mock_find_root, temp_meta_repo_rw):
         """Test creating a backup."""
-        mock_find_root.return_value = temp_meta_repo["path"]
+        mock_find_root.return_value = temp_meta_repo_rw["path"]
         
         # Create actual backup directory structure
-        backup_dir = temp_meta_repo["path"] / ".meta" / "backups"
+        backup_dir = temp_meta_repo_rw["path"] / ".meta" / "backups"
         backup_dir.mkdir(parents=True, exist_ok=True)
         backup_path = backup_dir / "test-backup"
         
@@ -37,14 +43,14 @@ class TestVendorBackup:
             assert result is not None
     
     @patch("meta.utils.vendor_backup.find_meta_repo_root")
-    @patch("shutil.copytree")
+    @patch("meta.utils.vendor_backup._fast_copytree")
     @patch("builtins.open", create=True)
-    def test_create_backup_no_components(self, mock_open, mock_copytree, mock_find_root, temp_meta_repo):
+    def test_create_backup_no_components(self, mock_open, mock_copytree, mock_find_root, temp_meta_repo_rw):
         """Test creating backup without components."""
-        mock_find_root.return_value = temp_meta_repo["path"]
+        mock_find_root.return_value = temp_meta_repo_rw["path"]
         
         # Create actual backup directory structure
-        backup_dir = temp_meta_repo["path"] / ".meta" / "backups"
+        backup_dir = temp_meta_repo_rw["path"] / ".meta" / "backups"
         backup_dir.mkdir(parents=True, exist_ok=True)
         
         # Mock file writing
@@ -64,9 +70,9 @@ class TestVendorBackup:
             assert backups == []
     
     @patch("meta.utils.vendor_backup.BACKUP_DIR")
-    def test_list_backups(self, mock_backup_dir, temp_meta_repo):
+    def test_list_backups(self, mock_backup_dir, temp_meta_repo_rw):
         """Test listing backups."""
-        backup_dir = temp_meta_repo["path"] / ".meta" / "backups" / "backup1"
+        backup_dir = temp_meta_repo_rw["path"] / ".meta" / "backups" / "backup1"
         backup_dir.mkdir(parents=True)
         
         metadata = {
@@ -81,14 +87,14 @@ class TestVendorBackup:
             assert len(backups) > 0
     
     @patch("meta.utils.vendor_backup.find_meta_repo_root")
-    @patch("shutil.copytree")
-    @patch("shutil.rmtree")
-    def test_restore_backup(self, mock_rmtree, mock_copytree, mock_find_root, temp_meta_repo):
+    @patch("meta.utils.vendor_backup._fast_copytree")
+    @patch("meta.utils.vendor_backup._fast_rmtree")
+    def test_restore_backup(self, mock_rmtree, mock_copytree, mock_find_root, temp_meta_repo_rw):
         """Test restoring from backup."""
-        mock_find_root.return_value = temp_meta_repo["path"]
+        mock_find_root.return_value = temp_meta_repo_rw["path"]
         
         # Create backup first
-        backup_dir = temp_meta_repo["path"] / ".meta" / "backups" / "test-backup"
+        backup_dir = temp_meta_repo_rw["path"] / ".meta" / "backups" / "test-backup"
         backup_dir.mkdir(parents=True)
         (backup_dir / "manifests").mkdir()
         (backup_dir / "backup_metadata.json").write_text(json.dumps({
@@ -113,3 +119,125 @@ class TestVendorBackup:
             # Latest should be the first one (sorted by created_at desc)
             assert latest['backup_name'] == 'backup2'
 
+    
+    def test_fast_copytree(self, temp_meta_repo_rw):
+        """Test the threaded tree copy preserves contents and honours ignore."""
+        src = temp_meta_repo_rw["components"] / "test-component"
+        (src / "src").mkdir(parents=True)
+        (src / "src" / "main.py").write_text("print('hello')")
+        (src / ".git").mkdir()
+        (src / ".git" / "HEAD").write_text("ref: refs/heads/main")
+        dst = temp_meta_repo_rw["path"] / "copy"
+        
+        _fast_copytree(src, dst, ignore=shutil.ignore_patterns(".git"))
+        
+        assert (dst / "src" / "main.py").read_text() == "print('hello')"
+        assert not (dst / ".git").exists()
+        assert (dst / "src" / "main.py").stat().st_mtime_ns == (src / "src" / "main.py").stat().st_mtime_ns
+    
+    def test_try_reflink_tree_unsupported(self, temp_meta_repo_rw):
+        """Test reflink falls back cleanly when the filesystem cannot clone."""
+        src = temp_meta_repo_rw["components"] / "test-component"
+        src.mkdir()
+        (src / "main.py").write_text("print('hello')")
+        dst = temp_meta_repo_rw["path"] / "clone"
+        
+        with patch("meta.utils.vendor_backup.sys.platform", "linux"), \
+             patch("meta.utils.vendor_backup._reflink_file",
+                   side_effect=OSError(errno.EOPNOTSUPP, "not supported")):
+            assert _try_reflink_tree(src, dst) is False
+        
+        assert not dst.exists()
+    
+    def test_snapshot_tree_hardlink_fallback(self, temp_meta_repo_rw):
+        """Test snapshots fall back to hardlinks when cloning is unsupported."""
+        src = temp_meta_repo_rw["components"] / "test-component"
+        (src / ".git").mkdir(parents=True)
+        (src / ".git" / "HEAD").write_text("ref: refs/heads/main")
+        (src / "main.py").write_text("print('hello')")
+        dst = temp_meta_repo_rw["path"] / "snapshot"
+        
+        with patch("meta.utils.vendor_backup._try_reflink_tree", return_value=False):
+            result = _snapshot_tree(src, dst, ignore=shutil.ignore_patterns(".git"),
+                                    hardlink=True)
+        
+        assert result == {'reflinked': False, 'hardlinked': True}
+        assert (dst / "main.py").stat().st_ino == (src / "main.py").stat().st_ino
+        assert not (dst / ".git").exists()
+    
+    def test_snapshot_tree_cross_device_copies(self, temp_meta_repo_rw):
+        """Test snapshots copy when hardlinks cross a filesystem boundary."""
+        src = temp_meta_repo_rw["components"] / "test-component"
+        src.mkdir()
+        (src / "main.py").write_text("print('hello')")
+        dst = temp_meta_repo_rw["path"] / "snapshot"
+        
+        with patch("meta.utils.vendor_backup._try_reflink_tree", return_value=False), \
+             patch("meta.utils.vendor_backup.os.link",
+                   side_effect=OSError(errno.EXDEV, "cross-device link")):
+            result = _snapshot_tree(src, dst, hardlink=True)
+        
+        assert result == {'reflinked': False, 'hardlinked': False}
+        assert (dst / "main.py").read_text() == "print('hello')"
+        assert (dst / "main.py").stat().st_ino != (src / "main.py").stat().st_ino
+    
+    def test_estimate_tree(self, temp_meta_repo_rw):
+        """Test counting files and bytes, honouring the ignore filter."""
+        src = temp_meta_repo_rw["components"] / "test-component"
+        (src / "src").mkdir(parents=True)
+        (src / "src" / "main.py").write_text("12345")
+        (src / "README").write_text("123")
+        (src / ".git").mkdir()
+        (src / ".git" / "HEAD").write_text("ref: refs/heads/main")
+        
+        assert _estimate_tree(src, ignore=shutil.ignore_patterns(".git")) == (2, 8)
+    
+    @patch("meta.utils.vendor_backup.find_meta_repo_root")
+    def test_create_backup_refuses_large_deep_copy(self, mock_find_root, temp_meta_repo_rw):
+        """Test that an oversized deep copy needs force_deep_copy."""
+        mock_find_root.return_value = temp_meta_repo_rw["path"]
+        (temp_meta_repo_rw["components"] / "test-component").mkdir()
+        (temp_meta_repo_rw["components"] / "test-component" / "main.py").write_text("print('hello')")
+        backup_dir = temp_meta_repo_rw["path"] / ".meta" / "backups"
+        
+        with patch("meta.utils.vendor_backup.BACKUP_DIR", backup_dir), \
+             patch("meta.utils.vendor_backup.BACKUP_DEEP_COPY_LIMIT_BYTES", 1), \
+             patch("meta.utils.vendor_backup._try_reflink_tree", return_value=False), \
+             patch("meta.utils.vendor_backup._try_hardlink_tree", return_value=False):
+            assert create_backup("too-big") is None
+            assert not (backup_dir / "too-big").exists()
+            
+            assert create_backup("too-big", force_deep_copy=True) is not None
+            assert (backup_dir / "too-big" / "components" / "test-component" / "main.py").exists()
+    
+    @patch("meta.utils.vendor_backup.find_meta_repo_root")
+    @patch("meta.utils.vendor_backup._estimate_tree")
+    def test_create_backup_sizes_only_deep_copies(self, mock_estimate, mock_find_root, temp_meta_repo_rw):
+        """Test that a linked snapshot does not walk the tree to size it."""
+        mock_find_root.return_value = temp_meta_repo_rw["path"]
+        (temp_meta_repo_rw["components"] / "test-component").mkdir()
+        (temp_meta_repo_rw["components"] / "test-component" / "main.py").write_text("print('hello')")
+        backup_dir = temp_meta_repo_rw["path"] / ".meta" / "backups"
+        
+        with patch("meta.utils.vendor_backup.BACKUP_DIR", backup_dir), \
+             patch("meta.utils.vendor_backup._try_reflink_tree", return_value=False):
+            assert create_backup("linked") is not None
+        
+        mock_estimate.assert_not_called()
+    
+    def test_fast_rmtree(self, temp_meta_repo_rw):
+        """Test deleting a nested tree, leaving symlink targets untouched."""
+        target = temp_meta_repo_rw["path"] / "target"
+        target.mkdir()
+        (target / "keep.txt").write_text("keep")
+        
+        tree = temp_meta_repo_rw["components"] / "test-component"
+        (tree / "a" / "b").mkdir(parents=True)
+        (tree / "a" / "b" / "file.txt").write_text("data")
+        (tree / "top.txt").write_text("data")
+        (tree / "link").symlink_to(target, target_is_directory=True)
+        
+        _fast_rmtree(tree)
+        
+        assert not tree.exists()
+        assert (target / "keep.txt").exists()
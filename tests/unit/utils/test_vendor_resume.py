@@ -2,7 +2,6 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
-from pathlib import Path
 import json
 from meta.utils.vendor_resume import (
     create_checkpoint,
@@ -16,11 +15,11 @@ from meta.utils.vendor_resume import (
 class TestVendorResume:
     """Test vendor resume utilities."""
     
-    @patch("meta.utils.vendor_resume.get_components")
+    @patch("meta.utils.vendor_resume.get_components_cached")
     @patch("meta.utils.vendor_resume.find_meta_repo_root")
-    def test_create_checkpoint(self, mock_find_root, mock_get_components, temp_meta_repo):
+    def test_create_checkpoint(self, mock_find_root, mock_get_components, temp_meta_repo_rw):
         """Test creating a checkpoint."""
-        mock_find_root.return_value = temp_meta_repo["path"]
+        mock_find_root.return_value = temp_meta_repo_rw["path"]
         mock_get_components.return_value = {
             "test-component": {
                 "repo": "git@github.com:test/test.git",
@@ -28,16 +27,32 @@ class TestVendorResume:
             }
         }
         
-        checkpoint = create_checkpoint("vendored", str(temp_meta_repo["manifests"]))
+        with patch("meta.utils.vendor_resume.RESUME_DIR", temp_meta_repo_rw["path"] / ".meta" / "resume"):
+            checkpoint = create_checkpoint("vendored", str(temp_meta_repo_rw["manifests"]))
         
         assert checkpoint is not None
         assert checkpoint.checkpoint_id is not None
         assert checkpoint.target_mode == "vendored"
         assert "test-component" in checkpoint.pending_components or "test-component" in checkpoint.completed_components
     
-    def test_load_checkpoint(self, temp_meta_repo):
+    @patch("meta.utils.vendor_resume.get_components_cached")
+    @patch("meta.utils.vendor_resume.find_meta_repo_root")
+    def test_create_checkpoint_reference_mode(self, mock_find_root, mock_get_components, temp_meta_repo_rw):
+        """Test that git checkouts count as converted in reference mode."""
+        mock_find_root.return_value = temp_meta_repo_rw["path"]
+        mock_get_components.return_value = {"cloned": {}, "vendored": {}, "missing": {}}
+        (temp_meta_repo_rw["components"] / "cloned" / ".git").mkdir(parents=True)
+        (temp_meta_repo_rw["components"] / "vendored").mkdir()
+        
+        with patch("meta.utils.vendor_resume.RESUME_DIR", temp_meta_repo_rw["path"] / ".meta" / "resume"):
+            checkpoint = create_checkpoint("reference", "manifests", checkpoint_id="checkpoint-ref")
+        
+        assert checkpoint.completed_components == {"cloned"}
+        assert checkpoint.pending_components == ["vendored", "missing"]
+    
+    def test_load_checkpoint(self, temp_meta_repo_rw):
         """Test loading a checkpoint."""
-        checkpoint_dir = temp_meta_repo["path"] / ".meta" / "resume" / "checkpoint-123"
+        checkpoint_dir = temp_meta_repo_rw["path"] / ".meta" / "resume" / "checkpoint-123"
         checkpoint_dir.mkdir(parents=True)
         
         checkpoint_data = {
@@ -57,9 +72,9 @@ class TestVendorResume:
             assert checkpoint is not None
             assert checkpoint.checkpoint_id == "checkpoint-123"
     
-    def test_checkpoint_mark_completed(self, temp_meta_repo):
+    def test_checkpoint_mark_completed(self, temp_meta_repo_rw):
         """Test marking component as completed."""
-        checkpoint_dir = temp_meta_repo["path"] / ".meta" / "resume" / "checkpoint-123"
+        checkpoint_dir = temp_meta_repo_rw["path"] / ".meta" / "resume" / "checkpoint-123"
         checkpoint_dir.mkdir(parents=True)
         
         with patch("meta.utils.vendor_resume.RESUME_DIR", checkpoint_dir.parent):
@@ -71,9 +86,9 @@ class TestVendorResume:
             assert "test-component" in checkpoint.completed_components
             assert "test-component" not in checkpoint.pending_components
     
-    def test_checkpoint_mark_failed(self, temp_meta_repo):
+    def test_checkpoint_mark_failed(self, temp_meta_repo_rw):
         """Test marking component as failed."""
-        checkpoint_dir = temp_meta_repo["path"] / ".meta" / "resume" / "checkpoint-123"
+        checkpoint_dir = temp_meta_repo_rw["path"] / ".meta" / "resume" / "checkpoint-123"
         checkpoint_dir.mkdir(parents=True)
         
         with patch("meta.utils.vendor_resume.RESUME_DIR", checkpoint_dir.parent):
@@ -85,9 +100,9 @@ class TestVendorResume:
             assert "test-component" in checkpoint.failed_components
             assert "test-component" not in checkpoint.pending_components
     
-    def test_checkpoint_get_progress(self, temp_meta_repo):
+    def test_checkpoint_get_progress(self, temp_meta_repo_rw):
         """Test getting checkpoint progress."""
-        checkpoint_dir = temp_meta_repo["path"] / ".meta" / "resume" / "checkpoint-123"
+        checkpoint_dir = temp_meta_repo_rw["path"] / ".meta" / "resume" / "checkpoint-123"
         checkpoint_dir.mkdir(parents=True)
         
         with patch("meta.utils.vendor_resume.RESUME_DIR", checkpoint_dir.parent):
@@ -123,9 +138,9 @@ class TestVendorResume:
         assert checkpoint is not None
         assert checkpoint.checkpoint_id == "checkpoint-123"
     
-    def test_list_checkpoints(self, temp_meta_repo):
+    def test_list_checkpoints(self, temp_meta_repo_rw):
         """Test listing checkpoints."""
-        checkpoint_dir = temp_meta_repo["path"] / ".meta" / "resume"
+        checkpoint_dir = temp_meta_repo_rw["path"] / ".meta" / "resume"
         checkpoint_dir.mkdir(parents=True)
         
         checkpoint1 = checkpoint_dir / "checkpoint-1"
@@ -139,4 +154,130 @@ class TestVendorResume:
         with patch("meta.utils.vendor_resume.RESUME_DIR", checkpoint_dir):
             checkpoints = list_checkpoints()
             assert len(checkpoints) > 0
+    
+    def test_list_checkpoints_reuses_unchanged(self, temp_meta_repo_rw):
+        """Test that listing only re-reads checkpoints whose files changed."""
+        resume_dir = temp_meta_repo_rw["path"] / ".meta" / "resume"
+        
+        with patch("meta.utils.vendor_resume.RESUME_DIR", resume_dir):
+            checkpoint = create_checkpoint("vendored", "manifests", checkpoint_id="checkpoint-cache")
+            checkpoint.pending_components = ["comp1", "comp2"]
+            checkpoint.save()
+            assert list_checkpoints()[0]['pending_components'] == ["comp1", "comp2"]
+            
+            with patch("meta.utils.vendor_resume.load_json") as mock_load:
+                assert list_checkpoints()[0]['pending_components'] == ["comp1", "comp2"]
+                mock_load.assert_not_called()
+            
+            checkpoint.mark_completed("comp1")
+            checkpoint.sync_log()
+            listed = list_checkpoints()[0]
+            assert listed['completed_components'] == ["comp1"]
+            assert listed['pending_components'] == ["comp2"]
 
+    
+    def test_checkpoint_append_completed_replayed_on_load(self, temp_meta_repo_rw):
+        """Test that appended completions survive a reload without a snapshot."""
+        resume_dir = temp_meta_repo_rw["path"] / ".meta" / "resume"
+        
+        with patch("meta.utils.vendor_resume.RESUME_DIR", resume_dir):
+            checkpoint = create_checkpoint("vendored", "manifests", checkpoint_id="checkpoint-log")
+            checkpoint.pending_components = ["comp1", "comp2"]
+            checkpoint.save()
+            
+            checkpoint.append_completed("comp1", sha="abc123")
+            checkpoint.sync_log()
+            
+            log_lines = (resume_dir / "checkpoint-log" / "checkpoint.log").read_text().splitlines()
+            assert len(log_lines) == 1
+            assert json.loads(log_lines[0])["sha"] == "abc123"
+            
+            loaded = load_checkpoint("checkpoint-log")
+            assert loaded.is_completed("comp1")
+            assert loaded.pending_components == ["comp2"]
+            
+            checkpoint.save()
+            assert not (resume_dir / "checkpoint-log" / "checkpoint.log").exists()
+    
+    def test_checkpoint_append_after_torn_record(self, temp_meta_repo_rw):
+        """Test that a record appended after a torn trailing write is replayed."""
+        resume_dir = temp_meta_repo_rw["path"] / ".meta" / "resume"
+        
+        with patch("meta.utils.vendor_resume.RESUME_DIR", resume_dir):
+            checkpoint = create_checkpoint("vendored", "manifests", checkpoint_id="checkpoint-torn")
+            checkpoint.pending_components = ["comp1", "comp2", "comp3"]
+            checkpoint.save()
+            # Interrupted run: one complete record, then a partial one
+            log_file = resume_dir / "checkpoint-torn" / "checkpoint.log"
+            log_file.write_bytes(b'{"op": "c", "n": "comp1"}\n{"op": "c", "n": "co')
+            
+            resumed = load_checkpoint("checkpoint-torn")
+            assert resumed.pending_components == ["comp2", "comp3"]
+            resumed.append_completed("comp2")
+            resumed.sync_log()
+            
+            loaded = load_checkpoint("checkpoint-torn")
+            assert loaded.completed_components == {"comp1", "comp2"}
+            assert loaded.pending_components == ["comp3"]
+            resumed.save()
+    
+    def test_checkpoint_mark_failed_journaled(self, temp_meta_repo_rw):
+        """Test that mark_failed appends to the journal rather than rewriting the snapshot."""
+        resume_dir = temp_meta_repo_rw["path"] / ".meta" / "resume"
+        
+        with patch("meta.utils.vendor_resume.RESUME_DIR", resume_dir):
+            checkpoint = create_checkpoint("vendored", "manifests", checkpoint_id="checkpoint-journal")
+            checkpoint.pending_components = ["comp1", "comp2"]
+            checkpoint.save()
+            snapshot = (resume_dir / "checkpoint-journal" / "checkpoint.json").read_text()
+            
+            checkpoint.mark_completed("comp1")
+            checkpoint.mark_failed("comp2")
+            checkpoint.sync_log()
+            
+            assert (resume_dir / "checkpoint-journal" / "checkpoint.json").read_text() == snapshot
+            
+            loaded = load_checkpoint("checkpoint-journal")
+            assert loaded.is_completed("comp1")
+            assert loaded.is_failed("comp2")
+            assert loaded.pending_components == []
+            
+            listed = list_checkpoints()
+            assert listed[0]['failed_components'] == ["comp2"]
+    
+    def test_checkpoint_state_transitions_keep_counts(self, temp_meta_repo_rw):
+        """Test that state transitions keep progress counters consistent."""
+        resume_dir = temp_meta_repo_rw["path"] / ".meta" / "resume"
+        
+        with patch("meta.utils.vendor_resume.RESUME_DIR", resume_dir):
+            checkpoint = create_checkpoint("vendored", "manifests", checkpoint_id="checkpoint-state")
+            checkpoint.pending_components = ["comp1", "comp2", "comp3"]
+            
+            checkpoint.mark_failed("comp1")
+            checkpoint.mark_completed("comp2")
+            checkpoint.mark_pending("comp1")
+            
+            assert checkpoint.pending_components == ["comp3", "comp1"]
+            assert checkpoint.completed_components == {"comp2"}
+            assert checkpoint.failed_components == set()
+            progress = checkpoint.get_progress()
+            assert (progress['completed'], progress['failed'], progress['pending']) == (1, 0, 2)
+    
+    def test_checkpoint_context_saves_snapshot(self, temp_meta_repo_rw):
+        """Test that leaving the checkpoint context folds the journal into the snapshot."""
+        resume_dir = temp_meta_repo_rw["path"] / ".meta" / "resume"
+        
+        with patch("meta.utils.vendor_resume.RESUME_DIR", resume_dir):
+            checkpoint = create_checkpoint("vendored", "manifests", checkpoint_id="checkpoint-ctx")
+            checkpoint.pending_components = ["comp1"]
+            
+            with pytest.raises(RuntimeError):
+                with checkpoint:
+                    checkpoint.mark_completed("comp1")
+                    raise RuntimeError("interrupted")
+            
+            checkpoint_dir = resume_dir / "checkpoint-ctx"
+            assert not (checkpoint_dir / "checkpoint.log").exists()
+            assert not (checkpoint_dir / "checkpoint.json.tmp").exists()
+            data = json.loads((checkpoint_dir / "checkpoint.json").read_text())
+            assert data['completed_components'] == ["comp1"]
@@ -1,8 +1,7 @@
 """Tests for vendor validation utilities."""
 
 import pytest
-from unittest.mock import patch, MagicMock
-from pathlib import Path
+from unittest.mock import patch
 from meta.utils.vendor_validation import (
     validate_prerequisites,
     validate_component_for_vendor,
@@ -0,0 +1,46 @@
+"""Tests for dependency visualization utilities."""
+
+from meta.utils.visualization import (
+    DependencyGraph,
+    generate_dot_graph,
+    generate_mermaid_graph,
+    generate_text_tree
+)
+
+
+COMPONENTS = {
+    "api": {"depends_on": ["db", "auth"]},
+    "auth": {"depends_on": ["db"]},
+    "db": {"depends_on": ["api"]},
+}
+
+
+class TestVisualization:
+    """Test graph renderers."""
+    
+    def test_renderers_share_graph(self):
+        """Test that all renderers accept a prebuilt graph."""
+        graph = DependencyGraph.from_components(COMPONENTS)
+        
+        assert generate_dot_graph(graph=graph) == generate_dot_graph(COMPONENTS)
+        assert generate_mermaid_graph(graph=graph).splitlines()[1:] == [
+            "    api --> db",
+            "    api --> auth",
+            "    auth --> db",
+            "    db --> api",
+        ]
+    
+    def test_text_tree_cuts_cycles_per_path(self):
+        """Test that a node is repeated across branches but not within a cycle."""
+        tree = generate_text_tree("api", COMPONENTS)
+        
+        assert tree.splitlines() == [
+            "api",
+            "  └── auth",
+            "    └── db",
+            "  └── db",
+        ]
+    
+    def test_text_tree_unknown_component(self):
+        """Test rendering a component that is not in the graph."""
+        assert generate_text_tree("missing", COMPONENTS) == "Component missing not found"